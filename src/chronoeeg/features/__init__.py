@@ -3,5 +3,6 @@
 from chronoeeg.features.base import BaseFeatureExtractor
 from chronoeeg.features.classical import ClassicalFeatureExtractor
 from chronoeeg.features.fmm import FMMFeatureExtractor
+from chronoeeg.utils.spectral import rfft_batch
 
-__all__ = ["ClassicalFeatureExtractor", "FMMFeatureExtractor", "BaseFeatureExtractor"]
+__all__ = ["ClassicalFeatureExtractor", "FMMFeatureExtractor", "BaseFeatureExtractor", "rfft_batch"]
@@ -0,0 +1,135 @@
+"""
+Compiled Feature Kernels
+
+Per-channel time-domain kernels shared by the feature extractors,
+JIT-compiled with numba and parallelized across channels. The vectorized
+NumPy implementation is the reference the kernel is tested against and
+handles signals too short for it. numba is a core dependency (antropy
+requires it too), so the NumPy path only replaces the kernel in test
+environments without numba.
+"""
+
+import contextlib
+import threading
+from typing import ContextManager, Tuple
+
+import numpy as np
+
+from chronoeeg.utils._jit import FASTMATH_FLAGS, HAS_NUMBA, readonly_array
+
+if HAS_NUMBA:
+    from numba import njit, prange, threading_layer, types
+
+# numba's fallback "workqueue" threading layer cannot run parallel kernels
+# launched concurrently from several threads, so launches are serialized
+# there; the TBB and OpenMP layers run them concurrently
+_PARALLEL_LAUNCH_LOCK = threading.Lock()
+
+
+def _parallel_launch_guard() -> ContextManager:
+    """Return the lock to hold around a parallel kernel launch, if any."""
+    try:
+        layer = threading_layer()
+    except ValueError:
+        # The layer is picked on the first parallel launch, which may be workqueue
+        return _PARALLEL_LAUNCH_LOCK
+    return _PARALLEL_LAUNCH_LOCK if layer == "workqueue" else contextlib.nullcontext()
+
+
+def hjorth_all(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute Hjorth parameters and line length for every channel.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        EEG data with shape (n_channels, n_samples)
+
+    Returns
+    -------
+    activity : np.ndarray
+        Variance of the signal, per channel
+    mobility : np.ndarray
+        sqrt(var(x') / var(x)), per channel
+    complexity : np.ndarray
+        Mobility of x' divided by mobility of x, per channel
+    line_length : np.ndarray
+        Sum of absolute first differences, per channel
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    # The compiled kernel needs at least three samples (one second difference)
+    if HAS_NUMBA and x.shape[1] >= 3:
+        with _parallel_launch_guard():
+            return _hjorth_all_numba(x)
+    return _hjorth_all_numpy(x)
+
+
+def _hjorth_all_numpy(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized NumPy implementation of hjorth_all."""
+    dx = np.diff(x, axis=1)
+    ddx = np.diff(dx, axis=1)
+
+    var0 = np.var(x, axis=1)
+    var1 = np.var(dx, axis=1)
+    var2 = np.var(ddx, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mobility = np.sqrt(var1 / var0)
+        complexity = np.sqrt(var2 / var1) / mobility
+
+    return var0, mobility, complexity, np.abs(dx).sum(axis=1)
+
+
+if HAS_NUMBA:
+
+    # Compiled eagerly for the C-contiguous float64 input hjorth_all passes
+    @njit(
+        types.UniTuple(types.float64[:], 4)(readonly_array(types.float64, 2)),
+        parallel=True,
+        nogil=True,
+        fastmath=FASTMATH_FLAGS,
+        error_model="numpy",
+        cache=True,
+    )
+    def _hjorth_all_numba(x):
+        """Numba implementation of hjorth_all: two fused passes per channel."""
+        n_channels, n_samples = x.shape
+        activity = np.empty(n_channels)
+        mobility = np.empty(n_channels)
+        complexity = np.empty(n_channels)
+        line_length = np.empty(n_channels)
+
+        for ch in prange(n_channels):
+            row = x[ch]
+
+            # First pass: means of x, x' and x'' (the latter two telescope)
+            total = 0.0
+            for i in range(n_samples):
+                total += row[i]
+            mean0 = total / n_samples
+            mean1 = (row[n_samples - 1] - row[0]) / (n_samples - 1)
+            mean2 = (row[n_samples - 1] - row[n_samples - 2] - row[1] + row[0]) / (n_samples - 2)
+
+            # Second pass: central moments of x, x' and x'', plus line length
+            ss0 = (row[0] - mean0) ** 2 + (row[1] - mean0) ** 2
+            d_prev = row[1] - row[0]
+            ss1 = (d_prev - mean1) ** 2
+            ss2 = 0.0
+            length = abs(d_prev)
+            for i in range(2, n_samples):
+                ss0 += (row[i] - mean0) ** 2
+                d = row[i] - row[i - 1]
+                ss1 += (d - mean1) ** 2
+                ss2 += (d - d_prev - mean2) ** 2
+                length += abs(d)
+                d_prev = d
+
+            var0 = ss0 / n_samples
+            var1 = ss1 / (n_samples - 1)
+            var2 = ss2 / (n_samples - 2)
+            activity[ch] = var0
+            mobility[ch] = np.sqrt(var1 / var0)
+            complexity[ch] = np.sqrt(var2 / var1) / mobility[ch]
+            line_length[ch] = length
+
+        return activity, mobility, complexity, line_length
@@ -2,7 +2,7 @@
 Classical EEG Feature Extraction
 
 This module extracts classical EEG features including entropy measures,
-fractal dimensions, and spectral band powers.
+fractal dimensions, spectral band powers, and (optionally) Hjorth parameters.
 """
 
 from typing import Dict, Union
@@ -13,6 +13,7 @@ import pandas as pd
 from scipy.integrate import simpson
 from scipy.signal import welch
 
+from chronoeeg.features._kernels import hjorth_all
 from chronoeeg.features.base import BaseFeatureExtractor
 
 
@@ -21,12 +22,15 @@ class ClassicalFeatureExtractor(BaseFeatureExtractor):
     Extract classical EEG features from multi-channel data.
 
     Computes entropy measures, fractal dimensions, and spectral features
-    for each channel, plus aggregate statistics across channels.
+    for each channel, plus aggregate statistics across channels. Hjorth
+    parameters and line length can be added on request.
 
     Parameters
     ----------
     sampling_rate : int
         Sampling frequency in Hz (default: 128)
+    include_hjorth : bool
+        Whether to add the Hjorth (HJO_) features (default: False)
 
     Attributes
     ----------
@@ -54,9 +58,10 @@ class ClassicalFeatureExtractor(BaseFeatureExtractor):
         "gamma": (30, 45),
     }
 
-    def __init__(self, sampling_rate: int = 128):
+    def __init__(self, sampling_rate: int = 128, include_hjorth: bool = False):
         """Initialize classical feature extractor."""
         super().__init__(sampling_rate)
+        self.include_hjorth = include_hjorth
 
     def extract(self, data: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
         """
@@ -89,6 +94,11 @@ class ClassicalFeatureExtractor(BaseFeatureExtractor):
         # Convert to DataFrame
         feature_df = pd.DataFrame(feature_list.tolist(), index=df.columns)
 
+        # Time-domain features are computed for all channels in one pass
+        if self.include_hjorth:
+            for name, values in self._compute_hjorth_features(df.to_numpy().T).items():
+                feature_df[name] = values
+
         # Flatten per-channel features
         feature_flat = feature_df.stack().to_frame().T
         feature_flat.columns = [f"{feature}_{channel}" for channel, feature in feature_flat.columns]
@@ -172,6 +182,35 @@ class ClassicalFeatureExtractor(BaseFeatureExtractor):
 
         return fractal_values
 
+    def _compute_hjorth_features(self, data: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute Hjorth parameters and line length for all channels.
+
+        Uses a numba kernel fused over the first and second differences.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Multi-channel EEG data with shape (n_channels, n_samples)
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Dictionary of per-channel features:
+            - HJO_activity: Hjorth activity (variance)
+            - HJO_mobility: Hjorth mobility
+            - HJO_complexity: Hjorth complexity
+            - HJO_line_length: Sum of absolute sample-to-sample differences
+        """
+        activity, mobility, complexity, line_length = hjorth_all(data)
+
+        return {
+            "HJO_activity": activity,
+            "HJO_mobility": mobility,
+            "HJO_complexity": complexity,
+            "HJO_line_length": line_length,
+        }
+
     def _compute_spectral_features(self, data: np.ndarray) -> Dict[str, float]:
         """
         Compute spectral power features.
@@ -11,11 +11,10 @@ from typing import Tuple, Union
 
 import numpy as np
 import pandas as pd
-from numpy.fft import fft, ifft
 from scipy import signal as sp_signal
-from sklearn.linear_model import LinearRegression
 
 from chronoeeg.features.base import BaseFeatureExtractor
+from chronoeeg.utils.spectral import fft_batch, ifft_batch
 
 
 class FMMFeatureExtractor(BaseFeatureExtractor):
@@ -61,7 +60,6 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         """Initialize FMM feature extractor."""
         super().__init__(sampling_rate)
         self.n_components = n_components
-        self._counter = None
 
     def extract(self, data: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
         """
@@ -120,11 +118,10 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         dic_an_search = self._generate_circle_disk(1, n_obs, 2 * pi - 2 * pi / n_obs)
         _, an_search_len = dic_an_search.shape
 
-        # Precompute FFT bases
-        base = np.zeros((an_search_len, n_obs), dtype=complex)
-        self._counter = -1
-        base = np.apply_along_axis(lambda row: self._get_fft_base(dic_an, t, n_obs), 1, base)
-        base = base.reshape((an_search_len, n_obs))
+        # Precompute FFT bases, one row per search magnitude
+        base = fft_batch(
+            self._complex_transform(dic_an[0, :an_search_len, np.newaxis], t), n_obs, axis=1
+        )
 
         # Initialize parameters
         an = np.zeros((self.n_components + 1), dtype=complex)
@@ -138,10 +135,9 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         for component in range(1, self.n_components + 1):
             S1_tmp = np.zeros((an_search_len, n_obs))
 
+            fft_residuals = fft_batch(residuals, n_obs, axis=1)
             for ch in range(n_channels):
-                fft_residual = fft(residuals[ch, :], n_obs)
-                fft_repeated = np.repeat(fft_residual[np.newaxis, :], an_search_len, axis=0)
-                S1_tmp += np.abs(ifft(fft_repeated * base, n_obs, 1))
+                S1_tmp += np.abs(ifft_batch(fft_residuals[ch, np.newaxis, :] * base, n_obs, axis=1))
 
             S1_tmp = S1_tmp.T
             max_loc_tmp = np.argwhere(S1_tmp == np.amax(S1_tmp))
@@ -209,11 +205,10 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         return ((1 - np.abs(x) ** 2) ** 0.5) / (1 - np.conj(x) * np.exp(1j * t))
 
     @staticmethod
-    def _calculate_coefficient(a: complex, t: np.ndarray, G: np.ndarray, n_obs: int) -> complex:
-        """Calculate FMM coefficient."""
-        denominator = (1 - np.conj(a) * np.exp(1j * t)).dot(G.conj().T)
-        if denominator == 0:
-            denominator = 0.000001 + 0.000001j
+    def _calculate_coefficient(a: complex, t: np.ndarray, G: np.ndarray, n_obs: int) -> np.ndarray:
+        """Calculate the FMM coefficient of every channel of G (n_channels, n_obs)."""
+        denominator = G.conj() @ (1 - np.conj(a) * np.exp(1j * t[0]))
+        denominator[denominator == 0] = 0.000001 + 0.000001j
         return np.conj(((1 - np.abs(a) ** 2) ** 0.5) / denominator) / n_obs
 
     def _generate_circle_disk(
@@ -265,23 +260,13 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         component: int,
     ):
         """Update channel residuals after extracting a component."""
-        for ch in range(n_channels):
-            coefficients[ch, component] = self._calculate_coefficient(
-                an[component], t, residuals[ch, :], n_obs
-            )[0]
-            residuals[ch, :] = (
-                (
-                    residuals[ch, :]
-                    - coefficients[ch, component] * self._complex_transform(an[component], t)
-                )
-                * (1 - np.conj(an[component]) * np.exp(1j * t))
-                / (np.exp(1j * t) - an[component])
-            )
-
-    def _get_fft_base(self, dic_an: np.ndarray, t: np.ndarray, n_obs: int) -> np.ndarray:
-        """Compute FFT base for search."""
-        self._counter += 1
-        return fft(self._complex_transform(dic_an[0, self._counter], t), n_obs)
+        a = an[component]
+        exp_t = np.exp(1j * t)
+        coefficients[:, component] = self._calculate_coefficient(a, t, residuals, n_obs)
+
+        # Remove the component and apply the inverse Blaschke factor to all channels at once
+        residuals -= coefficients[:, component, np.newaxis] * self._complex_transform(a, t)
+        residuals *= (1 - np.conj(a) * exp_t) / (exp_t - a)
 
     def _calculate_amplitudes_betas(
         self,
@@ -293,9 +278,6 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         data: np.ndarray,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Calculate amplitudes and phase shifts for each component."""
-        amplitudes = np.zeros((n_channels, n_components))
-        betas = np.zeros((n_channels, n_components))
-
         mm = np.zeros((len(t[0]), 2 * n_components + 1))
         mm[:, 0] = np.ones(len(t[0]))
 
@@ -306,11 +288,10 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
 
         mm = np.linalg.pinv(mm.T @ mm) @ mm.T
 
-        for ch in range(n_channels):
-            coefs = mm @ data[ch, :]
-            for i in range(n_components):
-                amplitudes[ch, i] = np.sqrt(coefs[2 * i + 1] ** 2 + coefs[2 * i + 2] ** 2)
-                betas[ch, i] = np.arctan2(-coefs[2 * i + 2], coefs[2 * i + 1])
+        # One least-squares solve for every channel: (2K + 1, n_channels)
+        coefs = mm @ data.T
+        amplitudes = np.hypot(coefs[1::2], coefs[2::2]).T
+        betas = np.arctan2(-coefs[2::2], coefs[1::2]).T
 
         betas = np.mod(betas, 2 * np.pi)
         return amplitudes, betas
@@ -329,25 +310,24 @@ class FMMFeatureExtractor(BaseFeatureExtractor):
         """Calculate R² (variance explained) for each component."""
         R2comp = np.zeros((n_channels, n_components + 1))
 
-        for component in range(n_components):
-            for ch in range(n_channels):
-                cos_phi = np.cos(
-                    betas[ch, component]
-                    + 2 * np.arctan(omegas[component] * np.tan((t - alphas2[component]) / 2))
-                )
+        variance = np.var(data, axis=1)
+        variance[variance == 0] = 0.00001
 
-                model = LinearRegression(n_jobs=1)
-                model.fit(cos_phi.reshape(-1, 1), residuals[ch, :].reshape(-1, 1))
+        for component in range(n_components):
+            t_star = 2 * np.arctan(omegas[component] * np.tan((t - alphas2[component]) / 2))
+            cos_phi = np.cos(betas[:, component, np.newaxis] + t_star)
 
-                intercept = model.intercept_[0]
-                coef = model.coef_[0, 0]
+            # Closed-form simple linear regression of each channel's residual on cos_phi
+            x_centered = cos_phi - cos_phi.mean(axis=1, keepdims=True)
+            y_mean = residuals.mean(axis=1, dtype=np.float64)
+            sxx = np.einsum("ij,ij->i", x_centered, x_centered)
+            sxy = np.einsum("ij,ij->i", x_centered, residuals)
+            coef = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
 
-                residuals[ch, :] -= (intercept + coef * cos_phi).flatten()
+            intercept = y_mean - coef * cos_phi.mean(axis=1)
+            residuals -= intercept[:, np.newaxis] + coef[:, np.newaxis] * cos_phi
 
-                variance = np.var(data[ch, :])
-                if variance == 0:
-                    variance = 0.00001
-                R2comp[ch, component + 1] = 1 - np.var(residuals[ch, :]) / variance
+            R2comp[:, component + 1] = 1 - np.var(residuals, axis=1) / variance
 
         R2comp = np.mean(np.diff(R2comp, axis=1), axis=0)
         R2comp = R2comp / np.sum(R2comp)
@@ -6,9 +6,19 @@ for WFDB format used in the I-CARE challenge dataset.
 """
 
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from joblib import Memory
+
+from chronoeeg.io.wfdb_reader import (
+    LazyRecording,
+    load_recording_data,
+    open_recording,
+    parse_metadata,
+    peek_header,
+)
 
 
 class EEGDataLoader:
@@ -23,6 +33,11 @@ class EEGDataLoader:
         Path to the root folder containing EEG data
     format : str, optional
         Data format ('wfdb', 'edf', 'bdf'). Default is 'wfdb'
+    cache_dir : str, optional
+        Directory for a persistent joblib cache of loaded patients. Cached
+        patients are invalidated when any file in the patient folder changes,
+        and are returned as regular writable data like uncached loads.
+        Default is None (no cache)
 
     Examples
     --------
@@ -31,14 +46,25 @@ class EEGDataLoader:
     >>> print(f"Loaded {eeg_data.shape[0]} samples from {eeg_data.shape[1]} channels")
     """
 
-    def __init__(self, data_folder: str, file_format: str = "wfdb"):
+    def __init__(
+        self, data_folder: str, file_format: str = "wfdb", cache_dir: Optional[str] = None
+    ):
         """Initialize the EEG data loader."""
         self.data_folder = data_folder
         self.file_format = file_format
+        self.cache_dir = cache_dir
 
         if not os.path.exists(data_folder):
             raise FileNotFoundError(f"Data folder not found: {data_folder}")
 
+        self._memory = None
+        if cache_dir is not None:
+            # No mmap_mode: hits are read into writable arrays, like cache misses
+            self._memory = Memory(cache_dir, verbose=0)
+            self._load_patient_cached = self._memory.cache(
+                type(self)._load_patient_data, ignore=["self"]
+            )
+
     def find_patients(self) -> List[str]:
         """
         Find all patient IDs in the data folder.
@@ -49,17 +75,22 @@ class EEGDataLoader:
             List of patient identifiers
         """
         patient_ids = []
-        for item in sorted(os.listdir(self.data_folder)):
-            patient_folder = os.path.join(self.data_folder, item)
-            if os.path.isdir(patient_folder) and not item.startswith("."):
+        with os.scandir(self.data_folder) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
                 # Check if folder contains patient data (metadata file or .hea files)
-                metadata_file = os.path.join(patient_folder, f"{item}.txt")
-                has_metadata = os.path.isfile(metadata_file)
-                has_recordings = any(f.endswith(".hea") for f in os.listdir(patient_folder))
-                if has_metadata or has_recordings:
-                    patient_ids.append(item)
+                has_metadata = os.path.isfile(os.path.join(entry.path, f"{entry.name}.txt"))
+                if has_metadata or self._scan_headers(entry.path):
+                    patient_ids.append(entry.name)
         return patient_ids
 
+    @staticmethod
+    def _scan_headers(folder: str) -> List[str]:
+        """List the .hea file names in a folder with a single directory scan."""
+        with os.scandir(folder) as entries:
+            return [e.name for e in entries if e.name.endswith(".hea") and e.is_file()]
+
     def list_recordings(self, patient_id: str) -> List[str]:
         """
         List all available recordings for a patient.
@@ -85,14 +116,8 @@ class EEGDataLoader:
         if not os.path.exists(patient_folder):
             raise FileNotFoundError(f"Patient folder not found: {patient_folder}")
 
-        recordings = []
-        for file_name in os.listdir(patient_folder):
-            if file_name.endswith(".hea"):
-                # Get base name without extension
-                recording_name = os.path.splitext(file_name)[0]
-                recordings.append(recording_name)
-
-        return sorted(recordings)
+        # Get base names without extension
+        return sorted(file_name[: -len(".hea")] for file_name in self._scan_headers(patient_folder))
 
     def load_patient(
         self, patient_id: str, recording_names: Optional[List[str]] = None
@@ -134,6 +159,38 @@ class EEGDataLoader:
         if not os.path.exists(patient_folder):
             raise FileNotFoundError(f"Patient folder not found: {patient_folder}")
 
+        if self._memory is not None:
+            # The folder signature makes the cache key change whenever a file is touched
+            return self._load_patient_cached(
+                self,
+                os.path.abspath(patient_folder),
+                patient_id,
+                recording_names,
+                signature=self._folder_signature(patient_folder),
+            )
+
+        return self._load_patient_data(patient_folder, patient_id, recording_names)
+
+    @staticmethod
+    def _folder_signature(folder: str) -> Tuple[Tuple[str, int, int], ...]:
+        """Return (name, mtime_ns, size) for every file in a folder, sorted by name."""
+        with os.scandir(folder) as entries:
+            stats = [(entry.name, entry.stat()) for entry in entries if entry.is_file()]
+        return tuple(sorted((name, stat.st_mtime_ns, stat.st_size) for name, stat in stats))
+
+    def _load_patient_data(
+        self,
+        patient_folder: str,
+        patient_id: str,
+        recording_names: Optional[List[str]] = None,
+        signature: Optional[Tuple] = None,
+    ) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Load metadata and recordings from a patient folder.
+
+        ``signature`` is unused here; it only takes part in the cache key when
+        this method is wrapped by the loader's joblib cache.
+        """
         # Load metadata
         metadata = self._load_metadata(patient_folder, patient_id)
 
@@ -156,7 +213,9 @@ class EEGDataLoader:
 
         return eeg_data, metadata
 
-    def load_recording(self, record_path: str) -> Tuple[pd.DataFrame, Dict]:
+    def load_recording(
+        self, record_path: str, lazy: bool = False
+    ) -> Tuple[Union[pd.DataFrame, LazyRecording], Dict]:
         """
         Load a specific EEG recording file.
 
@@ -164,25 +223,54 @@ class EEGDataLoader:
         ----------
         record_path : str
             Path to the recording file (without extension)
+        lazy : bool, optional
+            If True, return a LazyRecording exposing the digital samples plus
+            gains and offsets instead of converting everything to float32.
+            Default is False
 
         Returns
         -------
-        data : pd.DataFrame
-            EEG signal data
+        data : pd.DataFrame or LazyRecording
+            EEG signal data (float32)
         recording_metadata : Dict
             Recording-specific metadata (sampling rate, channels, etc.)
+
+        Examples
+        --------
+        >>> loader = EEGDataLoader(data_folder="path/to/data")
+        >>> recording, meta = loader.load_recording("path/to/0284_001_004_EEG", lazy=True)
+        >>> epoch = recording.to_physical(0, 300 * 128)  # converts this epoch only
         """
-        from chronoeeg.io.wfdb_reader import load_recording_data
+        if lazy:
+            recording = open_recording(record_path)
+            header = recording.header
+            recording_data = {
+                "sampling_frequency": header.sampling_frequency,
+                "num_samples": header.num_samples,
+                "channels": recording.channels,
+                "record_name": header.record_name,
+                "start_time": header.start_time,
+                "end_time": header.end_time,
+                "utility_frequency": header.utility_frequency,
+            }
+            return recording, self._recording_metadata(recording_data)
 
         # Load WFDB data
         recording_data = load_recording_data(record_path)
 
         # Convert to DataFrame
-        signals = recording_data["signals"]
-        channels = recording_data["channels"]
+        df = pd.DataFrame(
+            recording_data["signals"].astype(np.float32, copy=False),
+            columns=recording_data["channels"],
+            copy=False,
+        )
 
-        df = pd.DataFrame(signals, columns=channels)
+        return df, self._recording_metadata(recording_data)
 
+    @staticmethod
+    def _recording_metadata(recording_data: Dict) -> Dict:
+        """Build recording-level metadata from the output of load_recording_data."""
+        channels = recording_data["channels"]
         metadata = {
             "sampling_frequency": recording_data["sampling_frequency"],
             "num_samples": recording_data["num_samples"],
@@ -198,7 +286,7 @@ class EEGDataLoader:
         if recording_data.get("utility_frequency"):
             metadata["utility_frequency"] = recording_data["utility_frequency"]
 
-        return df, metadata
+        return metadata
 
     def _load_metadata(self, patient_folder: str, patient_id: str) -> Dict:
         """Load patient metadata from text file."""
@@ -209,17 +297,9 @@ class EEGDataLoader:
         if not os.path.exists(metadata_file):
             return metadata
 
+        # Handles both "# Key: Value" and "Key: Value" formats
         with open(metadata_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if ":" in line:
-                    # Handle both "# Key: Value" and "Key: Value" formats
-                    if line.startswith("#"):
-                        line = line.lstrip("#").strip()
-                    key, value = line.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    metadata[key] = value
+            metadata.update(parse_metadata(f.read()))
 
         return metadata
 
@@ -240,45 +320,71 @@ class EEGDataLoader:
         List[str]
             List of full paths to recording files (without extension)
         """
-        available_recordings = {}
-
-        # Find all .hea files
-        for file_name in os.listdir(patient_folder):
-            if file_name.endswith(".hea"):
-                # Get base name without extension (e.g., '0284_001_004_ECG')
-                record_name = os.path.splitext(file_name)[0]
-                record_path = os.path.join(patient_folder, record_name)
-                available_recordings[record_name] = record_path
+        # Record names of all .hea files (e.g., '0284_001_004_ECG'), in sorted order
+        available_recordings = sorted(
+            file_name[: -len(".hea")] for file_name in self._scan_headers(patient_folder)
+        )
 
         # Filter by requested recording names if specified
         if recording_names:
-            selected_recordings = []
+            available = set(available_recordings)
+            selected = set()
             for rec_name in recording_names:
-                if rec_name in available_recordings:
-                    selected_recordings.append(available_recordings[rec_name])
-                else:
-                    # Try partial match (user might provide short name)
-                    matches = [
-                        path for name, path in available_recordings.items() if rec_name in name
-                    ]
-                    if matches:
-                        selected_recordings.extend(matches)
-                    else:
-                        raise ValueError(
-                            f"Recording '{rec_name}' not found. Available: {list(available_recordings.keys())}"
-                        )
-            return sorted(selected_recordings)
-        else:
-            return sorted(list(available_recordings.values()))
+                if rec_name in available:
+                    selected.add(rec_name)
+                    continue
+                # Try partial match (user might provide short name)
+                matches = [name for name in available_recordings if rec_name in name]
+                if not matches:
+                    raise ValueError(
+                        f"Recording '{rec_name}' not found. Available: {available_recordings}"
+                    )
+                selected.update(matches)
+            available_recordings = [name for name in available_recordings if name in selected]
+
+        # Build full paths only for the recordings that are returned
+        return [os.path.join(patient_folder, name) for name in available_recordings]
 
     def _load_recordings(self, recording_files: List[str]) -> Tuple[pd.DataFrame, Dict]:
         """Load multiple recording files and concatenate.
 
+        When all recordings share the same channels, the signals are written
+        straight into one preallocated column-major array sized from the
+        headers, so the concatenated data is never copied.
+
         Returns
         -------
         Tuple[pd.DataFrame, Dict]
             Concatenated data and merged recording metadata
         """
+        if not recording_files:
+            return pd.DataFrame(), {}
+
+        headers = [peek_header(record_file) for record_file in recording_files]
+        channels = headers[0][1]
+        if any(record_channels != channels for _, record_channels in headers):
+            # Different montages: let pandas align the columns
+            return self._concat_recordings(recording_files)
+
+        total_samples = sum(num_samples for num_samples, _ in headers)
+        # Column-major, so every channel is contiguous inside the DataFrame's block
+        signals = np.empty((total_samples, len(channels)), dtype=np.float32, order="F")
+        recording_metadata = {}
+
+        offset = 0
+        for record_file, (num_samples, _) in zip(recording_files, headers):
+            recording_data = load_recording_data(
+                record_file, out=signals[offset : offset + num_samples]
+            )
+            offset += num_samples
+            # Merge metadata from first recording (for timing info)
+            if not recording_metadata:
+                recording_metadata = self._recording_metadata(recording_data)
+
+        return pd.DataFrame(signals, columns=channels, copy=False), recording_metadata
+
+    def _concat_recordings(self, recording_files: List[str]) -> Tuple[pd.DataFrame, Dict]:
+        """Load recordings with differing channels one by one and concatenate."""
         all_data = []
         recording_metadata = {}
 
@@ -289,10 +395,7 @@ class EEGDataLoader:
             if not recording_metadata:
                 recording_metadata = rec_meta
 
-        if all_data:
-            return pd.concat(all_data, ignore_index=True), recording_metadata
-        else:
-            return pd.DataFrame(), {}
+        return pd.concat(all_data, ignore_index=True), recording_metadata
 
 
 class MultiDatasetLoader:
@@ -6,12 +6,52 @@ adapted from the I-CARE challenge helper code.
 """
 
 import os
-from typing import Dict
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+# Gain specification of a signal line: gain, optional (baseline), optional /units
+_GAIN_RE = re.compile(r"([\d.eE+-]+)(?:\(([-\d.eE+]+)\))?(?:/\S+)?")
 
-def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
+# Metadata line "Key: Value", optionally commented as "#Key: Value"; splits at the first colon
+_META_RE = re.compile(r"^[ \t]*#*[ \t]*([^:\n]*?)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+@dataclass(frozen=True, eq=False)
+class HeaderInfo:
+    """
+    Parsed contents of a WFDB header file.
+
+    Numeric per-signal fields are read-only arrays, so a cached instance
+    can be shared safely between callers.
+    """
+
+    header_file: str
+    record_name: str
+    num_signals: int
+    sampling_frequency: float
+    num_samples: int
+    signal_file: str
+    signal_format: str
+    byte_offset: int
+    gains: np.ndarray
+    baselines: np.ndarray
+    adc_zeros: np.ndarray
+    initial_values: Tuple[int, ...]
+    checksums: Tuple[int, ...]
+    channels: Tuple[str, ...]
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    utility_frequency: Optional[str] = None
+
+
+def load_recording_data(
+    record_name: str, check_values: bool = False, out: Optional[np.ndarray] = None
+) -> Dict:
     """
     Load WFDB recording data.
 
@@ -21,6 +61,9 @@ def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
         Path to the record (with or without .hea extension)
     check_values : bool, optional
         Whether to verify checksums. Default is False
+    out : np.ndarray, optional
+        Preallocated float32 array of shape (num_samples, num_signals) to
+        write the rescaled signals into. Default is None (allocate a new one)
 
     Returns
     -------
@@ -42,29 +85,187 @@ def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
     ValueError
         If multiple signal files are referenced or format is invalid
     """
-    # Allow either the record name or the header filename
-    _root, ext = os.path.splitext(record_name)
-    if ext == "":
-        header_file = record_name + ".hea"
-    else:
-        header_file = record_name
+    header = _parse_header(record_name)
+    signals = _load_signals(header, check_values=check_values, out=out)
+
+    return {
+        "record_name": header.record_name,
+        "num_signals": header.num_signals,
+        "sampling_frequency": header.sampling_frequency,
+        "num_samples": header.num_samples,
+        "signals": signals,
+        "channels": list(header.channels),
+        "gains": header.gains.tolist(),
+        "baselines": header.baselines.tolist(),
+        "start_time": header.start_time,
+        "end_time": header.end_time,
+        "utility_frequency": header.utility_frequency,
+    }
+
+
+def peek_header(record_name: str) -> Tuple[int, List[str]]:
+    """
+    Read the sample count and channel names of a record without loading its signals.
+
+    Parameters
+    ----------
+    record_name : str
+        Path to the record (with or without .hea extension)
+
+    Returns
+    -------
+    num_samples : int
+        Number of samples per channel
+    channels : List[str]
+        Channel names in signal order
+    """
+    header = _parse_header(record_name)
+    return header.num_samples, list(header.channels)
+
+
+def open_recording(record_name: str) -> "LazyRecording":
+    """
+    Open a WFDB recording without converting its samples to physical units.
+
+    Parameters
+    ----------
+    record_name : str
+        Path to the record (with or without .hea extension)
+
+    Returns
+    -------
+    LazyRecording
+        Recording backed by the (memory-mapped, when possible) digital samples
+
+    Examples
+    --------
+    >>> recording = open_recording("path/to/0284_001_004_EEG")
+    >>> valid = ~recording.missing_mask().any(axis=1)
+    >>> first_minute = recording.to_physical(0, 60 * 128)
+    """
+    header = _parse_header(record_name)
+    return LazyRecording(header, _read_record_samples(header))
+
+
+class LazyRecording:
+    """
+    WFDB recording whose conversion to physical units is deferred.
+
+    Holds the digital int16 samples together with the header gains and
+    offsets, so that only the slices that are actually used get converted
+    to float32.
+
+    Parameters
+    ----------
+    header : HeaderInfo
+        Parsed header of the record
+    samples : np.ndarray
+        Digital samples with shape (num_samples, num_signals)
+    """
+
+    # WFDB marks invalid (missing) samples in format 16 with the minimum int16 value
+    INVALID_SAMPLE = -32768
+
+    def __init__(self, header: HeaderInfo, samples: np.ndarray):
+        """Initialize lazy recording."""
+        self.header = header
+        self.samples = samples
+
+    def __len__(self) -> int:
+        """Number of samples per channel."""
+        return self.header.num_samples
+
+    @property
+    def channels(self) -> List[str]:
+        """Channel names in signal order."""
+        return list(self.header.channels)
+
+    @property
+    def sampling_frequency(self) -> float:
+        """Sampling frequency in Hz."""
+        return self.header.sampling_frequency
+
+    @property
+    def gains(self) -> np.ndarray:
+        """Per-channel gains (digital units per physical unit)."""
+        return self.header.gains
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Per-channel digital offsets (baseline + ADC zero)."""
+        return self.header.baselines + self.header.adc_zeros
+
+    def missing_mask(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Mask of invalid samples, computed on the digital values.
+
+        Parameters
+        ----------
+        start, stop : int, optional
+            Sample range to inspect (default: whole recording)
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (stop - start, num_signals)
+        """
+        return self.samples[start:stop] == self.INVALID_SAMPLE
 
-    # Load the header file
+    def to_physical(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Convert a range of samples to physical units.
+
+        Parameters
+        ----------
+        start, stop : int, optional
+            Sample range to convert (default: whole recording)
+
+        Returns
+        -------
+        np.ndarray
+            Float32 signals of shape (stop - start, num_signals)
+        """
+        return _to_physical(self.samples[start:stop], self.header)
+
+
+def _parse_header(record_name: str) -> HeaderInfo:
+    """
+    Parse the header of a record, reusing the previous result if the file is unchanged.
+
+    Parameters
+    ----------
+    record_name : str
+        Path to the record (with or without .hea extension)
+
+    Returns
+    -------
+    HeaderInfo
+        Parsed header
+    """
+    header_file = _header_path(record_name)
     if not os.path.isfile(header_file):
         raise FileNotFoundError(f"{record_name} recording not found.")
 
+    stat = os.stat(header_file)
+    return _parse_header_file(os.path.abspath(header_file), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _parse_header_file(header_file: str, mtime_ns: int, size: int) -> HeaderInfo:
+    """Parse a header file; the modification time and size only key the cache."""
     with open(header_file, "r", encoding="utf-8") as f:
         header = [l.strip() for l in f.readlines() if l.strip()]
 
     # Parse the header file
-    record_name = None
     num_signals = None
     sampling_frequency = None
     num_samples = None
     signal_files = []
-    gains = []
-    baselines = []
-    adc_zeros = []
+    signal_formats = []
+    byte_offsets = []
+    gains = array("d")
+    baselines = array("d")
+    adc_zeros = array("d")
     channels = []
     initial_values = []
     checksums = []
@@ -73,10 +274,9 @@ def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
     utility_frequency = None
 
     for i, l in enumerate(header):
-        arrs = [arr.strip() for arr in l.split(" ")]
+        arrs = l.split()
         # Parse the record line
         if i == 0:
-            record_name = arrs[0]
             num_signals = int(arrs[1])
             sampling_frequency = float(arrs[2])
             num_samples = int(arrs[3])
@@ -91,17 +291,19 @@ def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
         # Parse the signal specification lines
         elif len(l.strip()) > 0:
             signal_file = arrs[0]
-            if "(" in arrs[2] and ")" in arrs[2]:
-                gain = float(arrs[2].split("/")[0].split("(")[0])
-                baseline = float(arrs[2].split("/")[0].split("(")[1].split(")")[0])
-            else:
-                gain = float(arrs[2].split("/")[0])
-                baseline = 0.0
+            signal_format, _, byte_offset = arrs[1].partition("+")
+            gain_spec = _GAIN_RE.match(arrs[2])
+            if gain_spec is None:
+                raise ValueError(f"Invalid gain specification '{arrs[2]}' in {header_file}")
+            gain = float(gain_spec.group(1))
+            baseline = float(gain_spec.group(2)) if gain_spec.group(2) else 0.0
             adc_zero = int(arrs[4])
             initial_value = int(arrs[5])
             checksum = int(arrs[6])
             channel = arrs[8]
             signal_files.append(signal_file)
+            signal_formats.append(signal_format)
+            byte_offsets.append(int(byte_offset) if byte_offset else 0)
             gains.append(gain)
             baselines.append(baseline)
             adc_zeros.append(adc_zero)
@@ -117,82 +319,241 @@ def load_recording_data(record_name: str, check_values: bool = False) -> Dict:
             "signal files; one signal file expected."
         )
 
-    # Load the signal file
     head, _tail = os.path.split(header_file)
-    signal_file = os.path.join(head, list(set(signal_files))[0])
 
-    # Load data from .mat file
-    import scipy.io
+    return HeaderInfo(
+        header_file=header_file,
+        record_name=os.path.splitext(os.path.basename(header_file))[0],
+        num_signals=num_signals,
+        sampling_frequency=sampling_frequency,
+        num_samples=num_samples,
+        signal_file=os.path.join(head, signal_files[0]),
+        signal_format=signal_formats[0],
+        byte_offset=byte_offsets[0],
+        gains=_readonly(gains),
+        baselines=_readonly(baselines),
+        adc_zeros=_readonly(adc_zeros),
+        initial_values=tuple(initial_values),
+        checksums=tuple(checksums),
+        channels=tuple(channels),
+        start_time=start_time,
+        end_time=end_time,
+        utility_frequency=utility_frequency,
+    )
+
 
-    data = np.asarray(scipy.io.loadmat(signal_file)["val"])
+def _readonly(values: array) -> np.ndarray:
+    """Wrap a float buffer as a read-only array without copying."""
+    arr = np.frombuffer(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+def _load_signals(
+    header: HeaderInfo, check_values: bool = False, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Load the signals of a parsed record and rescale them to physical units.
+
+    Parameters
+    ----------
+    header : HeaderInfo
+        Parsed header of the record
+    check_values : bool, optional
+        Whether to verify initial values and checksums. Default is False
+    out : np.ndarray, optional
+        Preallocated float32 array of shape (num_samples, num_signals)
+
+    Returns
+    -------
+    np.ndarray
+        Float32 signals with shape (num_samples, num_signals)
+    """
+    data = _read_record_samples(header)
+
+    # Verify initial values and checksums if requested
+    if check_values:
+        _check_values(data, header)
+
+    return _to_physical(data, header, out=out)
+
+
+def _check_values(data: np.ndarray, header: HeaderInfo):
+    """
+    Verify the initial values and checksums of all channels at once.
+
+    WFDB checksums are the 16-bit (wrapping) sum of the digital samples.
+    All inconsistent channels are reported in a single error.
+    """
+    channels = np.asarray(header.channels)
+
+    bad_initial = data[0] != np.asarray(header.initial_values)
+    if bad_initial.any():
+        raise ValueError(
+            f"The initial value in header file {header.header_file} "
+            f"is inconsistent with the initial value for channels {channels[bad_initial].tolist()}"
+        )
+
+    sums = data.sum(axis=0, dtype=np.int64).astype(np.int16)
+    bad_checksum = sums != np.asarray(header.checksums).astype(np.int16)
+    if bad_checksum.any():
+        raise ValueError(
+            f"The checksum in header file {header.header_file} "
+            f"is inconsistent with the checksum for channels {channels[bad_checksum].tolist()}"
+        )
+
+
+def _read_record_samples(header: HeaderInfo) -> np.ndarray:
+    """Read the digital samples of a parsed record as (num_samples, num_signals)."""
+    data = _read_samples(
+        header.signal_file, header.signal_format, header.byte_offset, header.num_signals
+    )
 
     # Check that dimensions match header
-    if data.shape != (num_signals, num_samples):
+    if data.shape != (header.num_samples, header.num_signals):
         raise ValueError(
-            f"The header file {header_file} indicates {num_signals} channels and {num_samples} samples, "
-            f"but the signal file has shape {data.shape}"
+            f"The header file {header.header_file} indicates {header.num_signals} channels "
+            f"and {header.num_samples} samples, but the signal file has shape {data.shape[::-1]}"
         )
 
-    # Verify initial values and checksums if requested
-    if check_values:
-        for i in range(num_signals):
-            if data[i, 0] != initial_values[i]:
-                raise ValueError(
-                    f"The initial value in header file {header_file} "
-                    f"is inconsistent with the initial value for channel {channels[i]}"
-                )
-            if np.sum(data[i, :], dtype=np.int16) != checksums[i]:
-                raise ValueError(
-                    f"The checksum in header file {header_file} "
-                    f"is inconsistent with the checksum for channel {channels[i]}"
-                )
-
-    # Rescale the signal data using gains and offsets
-    # Note: data is (num_channels, num_samples), need to transpose to (num_samples, num_channels)
-    signals = np.zeros((num_samples, num_signals), dtype=np.float32)
-    for i in range(num_signals):
-        signals[:, i] = (
-            np.asarray(data[i, :], dtype=np.float64) - baselines[i] - adc_zeros[i]
-        ) / gains[i]
+    return data
 
-    return {
-        "record_name": os.path.splitext(os.path.basename(header_file))[0],
-        "num_signals": num_signals,
-        "sampling_frequency": sampling_frequency,
-        "num_samples": num_samples,
-        "signals": signals,
-        "channels": channels,
-        "gains": gains,
-        "baselines": baselines,
-        "start_time": start_time,
-        "end_time": end_time,
-        "utility_frequency": utility_frequency,
-    }
 
+def _to_physical(
+    data: np.ndarray, header: HeaderInfo, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Rescale digital samples using gains and offsets in a single broadcast pass.
+
+    Unless ``out`` is given, the result is allocated column-major so that each
+    channel is contiguous and pandas can wrap it without a transposing copy.
+    """
+    offsets = (header.baselines + header.adc_zeros).astype(np.float32)
+    scale = header.gains.astype(np.float32)
+    if out is None:
+        out = np.empty(data.shape, dtype=np.float32, order="F")
+
+    np.subtract(data, offsets, out=out)
+    return np.divide(out, scale, out=out)
 
-def get_variable(string: str, variable_name: str, variable_type):
+
+def _header_path(record_name: str) -> str:
+    """Allow either the record name or the header filename."""
+    _root, ext = os.path.splitext(record_name)
+    return record_name + ".hea" if ext == "" else record_name
+
+
+def _read_samples(
+    signal_file: str, signal_format: str, byte_offset: int, num_signals: int
+) -> np.ndarray:
     """
-    Extract a variable from metadata string.
+    Read the digital samples of a signal file.
+
+    Format 16 files (16-bit little-endian, interleaved by sample) are
+    memory-mapped, so only the pages that are actually touched get read.
+    This includes the MAT v4 files produced by ``wfdb2mat``, whose header
+    line declares the byte offset of the sample block (e.g. ``16+24``).
+    Anything else is loaded through ``scipy.io.loadmat``.
 
     Parameters
     ----------
-    string : str
-        Full metadata text
+    signal_file : str
+        Path to the signal file
+    signal_format : str
+        WFDB storage format of the signals (e.g. '16')
+    byte_offset : int
+        Byte offset of the first sample in the file
+    num_signals : int
+        Number of interleaved signals
+
+    Returns
+    -------
+    np.ndarray
+        Digital samples with shape (num_samples, num_signals)
+    """
+    num_samples = _raw_sample_count(signal_file, byte_offset, num_signals)
+    if signal_format == "16" and num_samples is not None:
+        if num_samples == 0:
+            return np.empty((0, num_signals), dtype=np.int16)
+        return np.memmap(
+            signal_file,
+            dtype="<i2",
+            mode="r",
+            offset=byte_offset,
+            shape=(num_samples, num_signals),
+        )
+
+    import scipy.io
+
+    # MATLAB stores 'val' as (num_signals, num_samples)
+    return np.asarray(scipy.io.loadmat(signal_file)["val"]).T
+
+
+def _raw_sample_count(signal_file: str, byte_offset: int, num_signals: int) -> Optional[int]:
+    """
+    Count the samples stored as plain interleaved int16 in a signal file.
+
+    Returns None when the file cannot be memory-mapped directly, e.g. a
+    MAT v5 file or a MAT v4 file that does not hold a single int16 matrix.
+    """
+    if not signal_file.endswith(".mat"):
+        return max(os.path.getsize(signal_file) - byte_offset, 0) // (2 * num_signals)
+
+    # A MAT v4 matrix header is five int32 values: type, rows, cols, imagf, name length.
+    # Type 30 denotes a little-endian, int16, full numeric matrix.
+    mat_header = np.fromfile(signal_file, dtype="<i4", count=5)
+    if mat_header.size < 5:
+        return None
+    mat_type, rows, cols, imagf, name_length = (int(v) for v in mat_header)
+    if mat_type != 30 or rows != num_signals or imagf != 0 or byte_offset != 20 + name_length:
+        return None
+    return cols
+
+
+def parse_metadata(text: str) -> Dict[str, str]:
+    """
+    Parse "Key: Value" metadata lines in a single regex pass.
+
+    Lines may be commented ("#Key: Value"), which is how header files store
+    recording metadata. Lines without a colon are ignored, and later
+    duplicates override earlier ones.
+
+    Parameters
+    ----------
+    text : str
+        Full metadata text (patient .txt file or header contents)
+
+    Returns
+    -------
+    Dict[str, str]
+        Values by key, with surrounding whitespace removed
+    """
+    return dict(_META_RE.findall(text))
+
+
+def get_variable(string: Union[str, Dict[str, str]], variable_name: str, variable_type):
+    """
+    Extract a variable from metadata text.
+
+    Parameters
+    ----------
+    string : str or Dict[str, str]
+        Full metadata text, or the output of parse_metadata. Pass the parsed
+        dict when looking up several variables to scan the text only once
     variable_name : str
-        Name of the variable to extract (e.g., '#Age')
+        Name of the variable to extract (e.g., '#Age' or 'Age')
     variable_type : type
         Type to convert the value to
 
     Returns
     -------
     variable_type
-        Extracted and converted value
-    """
-    for line in string.split("\n"):
-        if line.startswith(variable_name):
-            value = line.split(":")[1].strip()
-            if variable_type == bool:
-                return value == "True"
-            else:
-                return variable_type(value)
-    return None
+        Extracted and converted value, or None if the variable is missing
+    """
+    metadata = string if isinstance(string, dict) else parse_metadata(string)
+    value = metadata.get(variable_name.lstrip("#").strip())
+    if value is None:
+        return None
+    if variable_type == bool:
+        return value == "True"
+    return variable_type(value)
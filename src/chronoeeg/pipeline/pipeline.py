@@ -4,16 +4,19 @@ End-to-End EEG Analysis Pipeline
 Provides high-level interfaces for complete EEG analysis workflows.
 """
 
-from typing import Dict, List, Optional, Union
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from joblib import effective_n_jobs
 from tqdm import tqdm
 
 from chronoeeg.features import ClassicalFeatureExtractor, FMMFeatureExtractor
 from chronoeeg.io import EEGDataLoader
 from chronoeeg.preprocessing import EpochExtractor
 from chronoeeg.quality import QualityAssessor
+from chronoeeg.utils import parallel_process, set_fft_workers
 
 
 class EEGAnalysisPipeline:
@@ -38,7 +41,8 @@ class EEGAnalysisPipeline:
     n_fmm_components : int
         Number of FMM components (default: 10)
     n_jobs : int
-        Number of parallel jobs (default: 1)
+        Number of threads used for per-epoch feature extraction in
+        process() (default: 1)
 
     Examples
     --------
@@ -221,19 +225,26 @@ class EEGAnalysisPipeline:
         # Step 2: Assess quality
         quality = self.quality_assessor.assess(epochs, epoch_column="epoch_id")
 
-        # Step 3: Extract features from each good epoch
-        all_features = []
-
-        for epoch_id in quality["epoch_id"]:
-            # Get epoch data
-            epoch_data = epochs[epochs["epoch_id"] == epoch_id]
-            epoch_data = epoch_data.drop(columns=["epoch_id"])
-
-            # Extract features
-            epoch_features = self._extract_features(epoch_data)
-            epoch_features["epoch_id"] = epoch_id
-
-            all_features.append(epoch_features)
+        # Step 3: Extract features from each good epoch. Each worker gets its
+        # epoch view explicitly (threads share it without pickling, and the
+        # FFT/NumPy work releases the GIL); the extractor's own reference to
+        # the input is dropped so it does not outlive this call
+        epoch_items = [
+            (epoch_id, self.epoch_extractor[epoch_id]) for epoch_id in quality["epoch_id"]
+        ]
+        self.epoch_extractor.clear_epochs()
+
+        # Each epoch's FFTs use all cores, unless the epochs themselves are
+        # spread over several threads
+        fft_workers = -1 if effective_n_jobs(self.n_jobs) == 1 else 1
+
+        all_features = parallel_process(
+            partial(self._extract_epoch_features, fft_workers=fft_workers),
+            epoch_items,
+            n_jobs=self.n_jobs,
+            desc="Extracting features",
+            prefer="threads",
+        )
 
         # Combine features
         if all_features:
@@ -243,12 +254,27 @@ class EEGAnalysisPipeline:
 
         return {"epochs": epochs, "quality": quality, "features": features_df}
 
-    def _extract_features(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Extract all configured features from an epoch."""
+    def _extract_epoch_features(
+        self, epoch_item: Tuple[int, pd.DataFrame], fft_workers: int = -1
+    ) -> pd.DataFrame:
+        """Extract features from an (epoch_id, epoch data) pair."""
+        epoch_id, epoch_data = epoch_item
+        epoch_features = self._extract_features(epoch_data, fft_workers=fft_workers)
+        epoch_features["epoch_id"] = epoch_id
+        return epoch_features
+
+    def _extract_features(self, data: pd.DataFrame, fft_workers: int = -1) -> pd.DataFrame:
+        """
+        Extract all configured features from an epoch.
+
+        ``fft_workers`` is the FFT worker count for the extractors' FFTs
+        (welch, hilbert, FMM); callers running several epochs at once pass 1.
+        """
         features = pd.DataFrame()
 
         for feature_type, extractor in self.extractors.items():
-            extracted = extractor.extract(data)
+            with set_fft_workers(fft_workers):
+                extracted = extractor.extract(data)
 
             # Prefix column names with feature type
             if feature_type != "classical":  # Classical already has prefixes
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 class EpochExtractor:
@@ -62,6 +63,11 @@ class EpochExtractor:
         self.samples_per_epoch = epoch_duration * sampling_rate
         self.step_size = int(self.samples_per_epoch * (1 - overlap))
 
+        # Set by fit_transform: strided view of the epochs over the input samples
+        self._epochs: Optional[np.ndarray] = None
+        self._columns: Optional[pd.Index] = None
+        self._dtypes: Optional[pd.Series] = None
+
     def extract(self, data: pd.DataFrame, metadata: Optional[Dict] = None) -> List[Dict]:
         """
         Extract epochs from continuous EEG data.
@@ -272,37 +278,83 @@ class EpochExtractor:
             raise ValueError("Input DataFrame is empty")
 
         n_samples = len(X)
-        epochs_list = []
-        epoch_id = 0
 
         # Calculate number of epochs
-        n_epochs = (n_samples - self.samples_per_epoch) // self.step_size + 1
-
-        for i in range(n_epochs):
-            start_idx = i * self.step_size
-            end_idx = start_idx + self.samples_per_epoch
-
-            if end_idx > n_samples:
-                break
+        n_epochs = max(0, (n_samples - self.samples_per_epoch) // self.step_size + 1)
 
-            # Extract epoch data
-            epoch_data = X.iloc[start_idx:end_idx].copy()
-            epoch_data["epoch_id"] = epoch_id
-
-            epochs_list.append(epoch_data)
-            epoch_id += 1
-
-        if not epochs_list:
+        if n_epochs == 0:
             raise ValueError(
                 f"No epochs could be extracted. Data has {n_samples} samples, "
                 f"need at least {self.samples_per_epoch} samples per epoch."
             )
 
-        # Concatenate all epochs
-        result = pd.concat(epochs_list, ignore_index=True)
+        # Zero-copy (n_epochs, samples_per_epoch, n_channels) view over the input samples
+        windows = sliding_window_view(X.to_numpy(), self.samples_per_epoch, axis=0)
+        self._epochs = windows[:: self.step_size][:n_epochs].transpose(0, 2, 1)
+        self._columns = X.columns
+        self._dtypes = X.dtypes
+
+        # Materialize the long-format result in a single copy
+        result = self._restore_dtypes(
+            pd.DataFrame(self._epochs.reshape(-1, len(X.columns)), columns=X.columns, copy=False)
+        )
+        result["epoch_id"] = np.repeat(np.arange(n_epochs), self.samples_per_epoch)
 
         return result
 
+    @property
+    def epochs_view(self) -> np.ndarray:
+        """
+        Epochs from the last fit_transform call as a read-only strided view.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_epochs, samples_per_epoch, n_channels) sharing
+            memory with the input data, in the common dtype of its columns
+
+        Raises
+        ------
+        ValueError
+            If fit_transform has not been called yet
+        """
+        if self._epochs is None:
+            raise ValueError("No epochs available. Call fit_transform first.")
+        return self._epochs
+
+    def __getitem__(self, epoch_id: int) -> pd.DataFrame:
+        """
+        Return one epoch from the last fit_transform call without copying.
+
+        Parameters
+        ----------
+        epoch_id : int
+            Epoch identifier, as in the epoch_id column of fit_transform
+
+        Returns
+        -------
+        pd.DataFrame
+            Epoch data with the original channel columns and dtypes (only
+            columns whose dtype differs from epochs_view's are copied)
+        """
+        return self._restore_dtypes(
+            pd.DataFrame(self.epochs_view[epoch_id], columns=self._columns, copy=False)
+        )
+
+    def _restore_dtypes(self, epochs: pd.DataFrame) -> pd.DataFrame:
+        """Cast columns back to the input dtypes lost in the single-dtype epoch view."""
+        # Mixed-dtype inputs are upcast by to_numpy (e.g. float32 + int64 -> float64)
+        changed = {
+            column: dtype for column, dtype in self._dtypes.items() if dtype != self._epochs.dtype
+        }
+        return epochs.astype(changed) if changed else epochs
+
+    def clear_epochs(self) -> None:
+        """Drop the epoch views of the last fit_transform call, releasing its input data."""
+        self._epochs = None
+        self._columns = None
+        self._dtypes = None
+
     def fit(self, X, y=None):
         """
         Fit method for sklearn compatibility (no-op).
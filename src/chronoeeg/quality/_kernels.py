@@ -0,0 +1,208 @@
+"""
+Compiled Quality Kernels
+
+Element-wise reductions behind the NaN, gap and outlier quality metrics,
+JIT-compiled with numba into fused loops that release the GIL. Equivalent
+NumPy expressions serve as the reference implementation and handle the
+dtypes the kernels are not compiled for; numba is a core dependency, so
+they only replace the kernels in test environments without numba.
+
+The single-metric kernels reduce over every value regardless of channel, so
+they work on the data flattened in memory order, which is free for C- and
+F-ordered arrays alike.
+
+The kernels are compiled eagerly for float32 and float64 data (see
+chronoeeg.utils._jit); other dtypes use the NumPy path.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from chronoeeg.utils._jit import FASTMATH_FLAGS, HAS_NUMBA, readonly_array
+
+if HAS_NUMBA:
+    from numba import njit, types
+
+# Dtypes the compiled kernels are specialized for
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def count_nan(arr: np.ndarray) -> int:
+    """
+    Count the missing (NaN) values of an array.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Float array of any shape
+
+    Returns
+    -------
+    int
+        Number of NaN values
+    """
+    flat = arr.ravel(order="K")
+    if HAS_NUMBA and flat.dtype in _KERNEL_DTYPES:
+        return int(_count_nan_numba(flat))
+    return int(np.count_nonzero(np.isnan(flat)))
+
+
+def count_outliers(arr: np.ndarray, threshold: float) -> int:
+    """
+    Count the values whose magnitude exceeds threshold times the global std.
+
+    The standard deviation is taken over all values, so any NaN makes it NaN
+    and no value is counted, matching ``np.abs(arr) > threshold * arr.std()``.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Float array of any shape
+    threshold : float
+        Number of standard deviations
+
+    Returns
+    -------
+    int
+        Number of outlying values
+    """
+    flat = arr.ravel(order="K")
+    if HAS_NUMBA and flat.dtype in _KERNEL_DTYPES:
+        return int(_count_outliers_numba(flat, float(threshold)))
+    return int(np.count_nonzero(np.abs(flat) > threshold * flat.std()))
+
+
+def nan_counts_and_outliers(arr: np.ndarray, threshold: float) -> Tuple[np.ndarray, int]:
+    """
+    Count NaNs per channel and outliers overall in one sweep over the data.
+
+    Shared statistics for the NaN, gap and outlier metrics: the per-channel
+    NaN counts give both the NaN score and the gap metric's best channel,
+    and the moments for the outlier threshold are accumulated in the same
+    pass.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        EEG data with shape (n_samples, n_channels)
+    threshold : float
+        Number of (global) standard deviations for the outlier count
+
+    Returns
+    -------
+    nan_counts : np.ndarray
+        Number of NaN values per channel
+    outliers : int
+        Same count as count_outliers(arr, threshold)
+    """
+    if HAS_NUMBA and arr.size > 0 and arr.dtype in _KERNEL_DTYPES:
+        # Walk the data in memory order: pandas' F-ordered blocks are swept
+        # channel by channel, C-ordered arrays sample by sample
+        if arr.flags.f_contiguous:
+            x, channels_first = arr.T, True
+        else:
+            x, channels_first = np.ascontiguousarray(arr), False
+        nan_counts, outliers = _nan_counts_and_outliers_numba(x, channels_first, float(threshold))
+        return nan_counts, int(outliers)
+
+    nan_counts = np.count_nonzero(np.isnan(arr), axis=0)
+    if nan_counts.any():
+        # A NaN makes the global std NaN, so no value can exceed the threshold
+        return nan_counts, 0
+    return nan_counts, int(np.count_nonzero(np.abs(arr) > threshold * arr.std()))
+
+
+if HAS_NUMBA:
+
+    _OPTIONS = dict(nogil=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+
+    _FLAT = [readonly_array(dtype, 1) for dtype in (types.float32, types.float64)]
+    _MATRIX = [readonly_array(dtype, 2) for dtype in (types.float32, types.float64)]
+
+    @njit([types.int64(flat) for flat in _FLAT], **_OPTIONS)
+    def _count_nan_numba(flat):
+        """Numba implementation of count_nan."""
+        count = 0
+        for i in range(flat.size):
+            if np.isnan(flat[i]):
+                count += 1
+        return count
+
+    @njit([types.int64(flat, types.float64) for flat in _FLAT], **_OPTIONS)
+    def _count_outliers_numba(flat, threshold):
+        """Numba implementation of count_outliers: mean, variance and count passes."""
+        n = flat.size
+        total = 0.0
+        for i in range(n):
+            total += flat[i]
+        mean = total / n
+
+        ss = 0.0
+        for i in range(n):
+            ss += (flat[i] - mean) ** 2
+        limit = threshold * np.sqrt(ss / n)
+
+        count = 0
+        for i in range(n):
+            if abs(flat[i]) > limit:
+                count += 1
+        return count
+
+    @njit(
+        [
+            types.Tuple((types.int64[:], types.int64))(x, types.boolean, types.float64)
+            for x in _MATRIX
+        ],
+        **_OPTIONS,
+    )
+    def _nan_counts_and_outliers_numba(x, channels_first, threshold):
+        """
+        Numba implementation of nan_counts_and_outliers on C-contiguous data.
+
+        x is (n_channels, n_samples) when channels_first, else (n_samples, n_channels).
+        """
+        n_rows, n_cols = x.shape
+        n_channels = n_rows if channels_first else n_cols
+        nan_counts = np.zeros(n_channels, dtype=np.int64)
+
+        # First pass: NaN counts plus sums shifted by the first value, which
+        # keeps the one-pass variance accurate for signals with a DC offset
+        shift = x[0, 0]
+        total = 0.0
+        total_sq = 0.0
+        if channels_first:
+            for ch in range(n_rows):
+                count = 0
+                for i in range(n_cols):
+                    v = x[ch, i]
+                    if np.isnan(v):
+                        count += 1
+                    d = v - shift
+                    total += d
+                    total_sq += d * d
+                nan_counts[ch] = count
+        else:
+            for i in range(n_rows):
+                for ch in range(n_cols):
+                    v = x[i, ch]
+                    if np.isnan(v):
+                        nan_counts[ch] += 1
+                    d = v - shift
+                    total += d
+                    total_sq += d * d
+
+        if nan_counts.sum() > 0:
+            return nan_counts, 0
+
+        n = n_rows * n_cols
+        mean = total / n
+        limit = threshold * np.sqrt(max(total_sq / n - mean * mean, 0.0))
+
+        # Second pass: outlier count against the global threshold
+        outliers = 0
+        for i in range(n_rows):
+            for j in range(n_cols):
+                if abs(x[i, j]) > limit:
+                    outliers += 1
+        return nan_counts, outliers
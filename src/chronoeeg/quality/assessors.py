@@ -149,10 +149,10 @@ class QualityAssessor:
             "end_time": end_time,
         }
 
-        # Calculate individual quality metrics
-        quality_scores["nan_score"] = metrics.calculate_nan_quality(data)
-        quality_scores["gap_score"] = metrics.calculate_gap_quality(data)
-        quality_scores["outlier_score"] = metrics.calculate_outlier_quality(data, threshold=2.0)
+        # NaN, gap and outlier scores share one sweep over the data
+        quality_scores.update(metrics.calculate_basic_quality(data, threshold=2.0))
+
+        # Calculate remaining quality metrics
         quality_scores["flatline_score"] = metrics.calculate_flatline_quality(
             data, self.sampling_rate
         )
@@ -187,12 +187,10 @@ class QualityAssessor:
         pd.DataFrame
             Quality metrics for each epoch
         """
-        epoch_ids = epochs[epoch_column].unique()
         quality_results = []
 
-        for epoch_id in epoch_ids:
-            # Get data for this epoch
-            epoch_data = epochs[epochs[epoch_column] == epoch_id]
+        # Single grouping pass instead of one boolean gather per epoch
+        for epoch_id, epoch_data in epochs.groupby(epoch_column, sort=False):
             epoch_data = epoch_data.drop(columns=[epoch_column])
 
             # Assess quality
@@ -4,69 +4,88 @@ Individual Quality Metrics
 This module contains functions for calculating specific EEG quality metrics.
 """
 
+import warnings
+from typing import Dict, Union
+
 import numpy as np
 import pandas as pd
 from scipy.signal import hilbert
 
+from chronoeeg.quality._kernels import count_nan, count_outliers, nan_counts_and_outliers
+
+
+def _as_array(data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """Return EEG data as a 2-D float (n_samples, n_channels) array, without copying if possible."""
+    arr = data.to_numpy() if isinstance(data, pd.DataFrame) else np.asarray(data)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+    return arr.reshape(-1, 1) if arr.ndim == 1 else arr
+
 
-def calculate_nan_quality(data: pd.DataFrame) -> float:
+def calculate_nan_quality(data: Union[pd.DataFrame, np.ndarray]) -> float:
     """
     Calculate quality based on missing (NaN) values.
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
 
     Returns
     -------
     float
-        Quality score (0-100), where 100 = no missing values
+        Quality score (0-100), where 100 = no missing values; NaN for empty data
     """
-    total_values = data.size
-    missing_values = data.isna().sum().sum()
-    quality = (1 - missing_values / total_values) * 100
+    arr = _as_array(data)
+    if arr.size == 0:
+        return np.nan
+    missing_values = count_nan(arr)
+    quality = (1 - missing_values / arr.size) * 100
     return quality
 
 
-def calculate_gap_quality(data: pd.DataFrame) -> float:
+def calculate_gap_quality(data: Union[pd.DataFrame, np.ndarray]) -> float:
     """
     Calculate quality based on longest continuous valid segment.
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
 
     Returns
     -------
     float
-        Quality score (0-100), based on longest gap-free segment
+        Quality score (0-100), based on longest gap-free segment; NaN for empty data
     """
+    nan_mask = np.isnan(_as_array(data))
+    if nan_mask.size == 0:
+        return np.nan
+
     # Find channel with fewest missing values
-    missing_percentages = data.isna().mean()
-    best_channel = missing_percentages.idxmin()
-    best_channel_data = data[best_channel].values
+    best_channel = np.argmin(np.count_nonzero(nan_mask, axis=0))
 
-    # Find longest valid subsequence
-    mask = ~np.isnan(best_channel_data)
-    diff = np.diff(np.concatenate(([0], mask.astype(int), [0])))
-    starts = np.where(diff == 1)[0]
-    ends = np.where(diff == -1)[0]
+    return _longest_valid_run(~nan_mask[:, best_channel]) / nan_mask.shape[0] * 100
 
-    longest_segment = np.max(ends - starts) if starts.size > 0 else 0
-    quality = (longest_segment / len(data)) * 100
 
-    return quality
+def _longest_valid_run(valid: np.ndarray) -> int:
+    """Length of the longest run of True values, from the edges of the valid runs."""
+    diff = np.diff(valid.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(diff == 1)
+    ends = np.flatnonzero(diff == -1)
+
+    return int(np.max(ends - starts)) if starts.size > 0 else 0
 
 
-def calculate_outlier_quality(data: pd.DataFrame, threshold: float = 2.0) -> float:
+def calculate_outlier_quality(
+    data: Union[pd.DataFrame, np.ndarray], threshold: float = 2.0
+) -> float:
     """
     Calculate quality based on outlier detection.
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
     threshold : float
         Number of standard deviations for outlier detection
@@ -74,17 +93,62 @@ def calculate_outlier_quality(data: pd.DataFrame, threshold: float = 2.0) -> flo
     Returns
     -------
     float
-        Quality score (0-100), where 100 = no outliers
+        Quality score (0-100), where 100 = no outliers; NaN for empty data
     """
-    std_all = data.values.std()
-    anomalies = np.abs(data) > (threshold * std_all)
-    quality = 100 * (1 - anomalies.sum().sum() / data.size)
+    arr = _as_array(data)
+    if arr.size == 0:
+        return np.nan
+    anomalies = count_outliers(arr, threshold)
+    quality = 100 * (1 - anomalies / arr.size)
 
     return quality
 
 
+def calculate_basic_quality(
+    data: Union[pd.DataFrame, np.ndarray], threshold: float = 2.0
+) -> Dict[str, float]:
+    """
+    Calculate the NaN, gap and outlier scores together.
+
+    Equivalent to calling calculate_nan_quality, calculate_gap_quality and
+    calculate_outlier_quality, but the data is swept once for the NaN counts
+    and the moments, and once more for the outlier count, instead of once
+    per metric.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or np.ndarray
+        EEG data
+    threshold : float
+        Number of standard deviations for outlier detection
+
+    Returns
+    -------
+    Dict[str, float]
+        'nan_score', 'gap_score' and 'outlier_score' (0-100 each; NaN for empty data)
+    """
+    arr = _as_array(data)
+    if arr.size == 0:
+        return {"nan_score": np.nan, "gap_score": np.nan, "outlier_score": np.nan}
+    nan_counts, outliers = nan_counts_and_outliers(arr, threshold)
+    n_samples = arr.shape[0]
+
+    # The gap metric only needs the NaN mask of the most complete channel
+    best_channel = np.argmin(nan_counts)
+    if nan_counts[best_channel] == 0:
+        longest_segment = n_samples
+    else:
+        longest_segment = _longest_valid_run(~np.isnan(arr[:, best_channel]))
+
+    return {
+        "nan_score": (1 - nan_counts.sum() / arr.size) * 100,
+        "gap_score": longest_segment / n_samples * 100,
+        "outlier_score": 100 * (1 - outliers / arr.size),
+    }
+
+
 def calculate_flatline_quality(
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, np.ndarray],
     sampling_rate: int,
     flat_duration_sec: float = 5.0,
     cv_threshold: float = 0.01,
@@ -94,7 +158,7 @@ def calculate_flatline_quality(
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
     sampling_rate : int
         Sampling frequency in Hz
@@ -110,6 +174,10 @@ def calculate_flatline_quality(
     """
     window_size = int(round(flat_duration_sec * sampling_rate))
 
+    # Rolling windows come from pandas; arrays are wrapped without copying
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(_as_array(data), copy=False)
+
     rolling = data.rolling(window=window_size, min_periods=1)
     rolling_mean = rolling.mean()
     rolling_std = rolling.std()
@@ -124,13 +192,15 @@ def calculate_flatline_quality(
     return quality
 
 
-def calculate_sharpness_quality(data: pd.DataFrame, amplitude_threshold: float = 0.05) -> float:
+def calculate_sharpness_quality(
+    data: Union[pd.DataFrame, np.ndarray], amplitude_threshold: float = 0.05
+) -> float:
     """
     Calculate quality based on sharp transitions/artifacts.
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
     amplitude_threshold : float
         Threshold relative to 95th percentile for sharp transition detection
@@ -140,22 +210,28 @@ def calculate_sharpness_quality(data: pd.DataFrame, amplitude_threshold: float =
     float
         Quality score (0-100), where 100 = no sharp artifacts
     """
-    diff_signal = data.diff().abs()
-    signal_percentile = data.abs().quantile(0.95, axis=0)
+    arr = _as_array(data)
+    diff_signal = np.abs(np.diff(arr, axis=0))
+
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        # All-NaN channels have no percentile and no valid samples; they are skipped
+        warnings.simplefilter("ignore", RuntimeWarning)
+        signal_percentile = np.nanquantile(np.abs(arr), 0.95, axis=0)
 
-    large_changes = diff_signal >= amplitude_threshold * signal_percentile
-    large_changes = large_changes.where(~diff_signal.isna(), np.nan)
+        # NaN differences compare as False and are excluded from the valid samples
+        num_large_changes = np.count_nonzero(
+            diff_signal >= amplitude_threshold * signal_percentile, axis=0
+        )
+        valid_samples = np.count_nonzero(~np.isnan(diff_signal), axis=0)
 
-    num_large_changes = large_changes.sum(axis=0, skipna=True)
-    valid_samples = large_changes.notna().sum(axis=0)
+        prop_large_changes = np.nanmean(num_large_changes / valid_samples)
 
-    prop_large_changes = (num_large_changes / valid_samples).mean()
     quality = 100 * (1 - prop_large_changes)
 
     return quality
 
 
-def calculate_cohesion_quality(data: pd.DataFrame) -> float:
+def calculate_cohesion_quality(data: Union[pd.DataFrame, np.ndarray]) -> float:
     """
     Calculate quality based on phase-locking between channels.
 
@@ -163,7 +239,7 @@ def calculate_cohesion_quality(data: pd.DataFrame) -> float:
 
     Parameters
     ----------
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         EEG data
 
     Returns
@@ -172,7 +248,9 @@ def calculate_cohesion_quality(data: pd.DataFrame) -> float:
         Quality score (0-100), based on average PLV
     """
     # Fill NaN for Hilbert transform
-    eeg_data = data.fillna(0).values.T
+    arr = _as_array(data)
+    nan_mask = np.isnan(arr)
+    eeg_data = (np.where(nan_mask, 0.0, arr) if nan_mask.any() else arr).T
 
     # Compute phases via Hilbert transform
     phases = np.angle(hilbert(eeg_data, axis=1))
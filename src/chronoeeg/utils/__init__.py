@@ -1,6 +1,15 @@
 """Utility functions and helpers."""
 
 from chronoeeg.utils.parallel import parallel_process, ParallelProcessor
+from chronoeeg.utils.spectral import fft_batch, ifft_batch, rfft_batch, set_fft_workers
 from chronoeeg.utils.time import TimeHelper
 
-__all__ = ["TimeHelper", "parallel_process", "ParallelProcessor"]
+__all__ = [
+    "TimeHelper",
+    "parallel_process",
+    "ParallelProcessor",
+    "rfft_batch",
+    "fft_batch",
+    "ifft_batch",
+    "set_fft_workers",
+]
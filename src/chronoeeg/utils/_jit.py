@@ -0,0 +1,26 @@
+"""
+Shared settings for the numba-compiled kernels.
+
+The kernels are compiled eagerly from explicit signatures when their module
+is imported (and loaded from numba's on-disk cache afterwards), so the first
+call does not pay the JIT warm-up. Array arguments use read-only types (see
+readonly_array), which also accept writable arrays, so one signature per
+dtype covers regular and memory-mapped input alike.
+"""
+
+try:
+    from numba import types
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# fastmath subset for the kernels' reductions: reassociation and contraction
+# let LLVM vectorize the accumulation loops, while NaN/inf semantics are kept
+# (no "nnan"/"ninf"), so NaN inputs still propagate or are counted correctly
+FASTMATH_FLAGS = {"reassoc", "contract", "nsz", "arcp"}
+
+
+def readonly_array(dtype, ndim: int):
+    """Return the numba type of a read-only C-contiguous array, for kernel signatures."""
+    return types.Array(dtype, ndim, "C", readonly=True)
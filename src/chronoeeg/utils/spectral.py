@@ -0,0 +1,141 @@
+"""
+Spectral transform helpers shared by the feature extractors.
+
+Transforms go through scipy's pocketfft. When pyFFTW is installed its
+scipy-compatible interface is used instead, with the plan cache enabled so
+repeated transforms of the same epoch length reuse one FFTW plan.
+
+Unless a worker count is passed, transforms run on all cores, or on the
+count set by an enclosing set_fft_workers context.
+"""
+
+import contextlib
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+import scipy.fft
+
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as _fft_backend
+
+    pyfftw.interfaces.cache.enable()
+    HAS_PYFFTW = True
+except ImportError:
+    _fft_backend = scipy.fft
+    HAS_PYFFTW = False
+
+
+# Per-thread default worker count of the batch helpers, like scipy.fft's own
+_config = threading.local()
+
+
+@contextlib.contextmanager
+def set_fft_workers(workers: int) -> Iterator[None]:
+    """
+    Set the default FFT worker count in the current thread.
+
+    Applies to the batch helpers of this module and, through
+    ``scipy.fft.set_workers``, to scipy's own transforms (e.g. in welch and
+    hilbert). Code that already runs one epoch per thread passes 1 so the
+    threads do not each start a full-core FFT pool.
+
+    Parameters
+    ----------
+    workers : int
+        Number of threads per transform (-1 = all cores)
+    """
+    previous = getattr(_config, "workers", None)
+    _config.workers = workers
+    try:
+        with scipy.fft.set_workers(workers):
+            yield
+    finally:
+        _config.workers = previous
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Return workers, or the set_fft_workers default (all cores outside one) when None."""
+    if workers is not None:
+        return workers
+    default = getattr(_config, "workers", None)
+    return -1 if default is None else default
+
+
+def rfft_batch(
+    x: np.ndarray, n: Optional[int] = None, axis: int = -1, workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Compute the real FFT of a batch of signals with the configured FFT backend.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Real input, e.g. (n_channels, n_samples)
+    n : int, optional
+        Transform length; the input is cropped or zero-padded to it
+    axis : int
+        Axis over which to compute the transform (default: -1)
+    workers : int, optional
+        Number of threads used across the batch (-1 = all cores). By default
+        all cores, or the count of an enclosing set_fft_workers context
+
+    Returns
+    -------
+    np.ndarray
+        Complex spectrum of length n // 2 + 1 along ``axis``
+    """
+    return _fft_backend.rfft(x, n=n, axis=axis, workers=_resolve_workers(workers))
+
+
+def fft_batch(
+    x: np.ndarray, n: Optional[int] = None, axis: int = -1, workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Compute the complex FFT of a batch of signals with the configured FFT backend.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Input, e.g. analytic signals of shape (n_channels, n_samples)
+    n : int, optional
+        Transform length; the input is cropped or zero-padded to it
+    axis : int
+        Axis over which to compute the transform (default: -1)
+    workers : int, optional
+        Number of threads used across the batch (-1 = all cores). By default
+        all cores, or the count of an enclosing set_fft_workers context
+
+    Returns
+    -------
+    np.ndarray
+        Complex spectrum along ``axis``
+    """
+    return _fft_backend.fft(x, n=n, axis=axis, workers=_resolve_workers(workers))
+
+
+def ifft_batch(
+    x: np.ndarray, n: Optional[int] = None, axis: int = -1, workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Compute the inverse complex FFT of a batch of spectra with the configured FFT backend.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Complex spectra
+    n : int, optional
+        Transform length; the input is cropped or zero-padded to it
+    axis : int
+        Axis over which to compute the transform (default: -1)
+    workers : int, optional
+        Number of threads used across the batch (-1 = all cores). By default
+        all cores, or the count of an enclosing set_fft_workers context
+
+    Returns
+    -------
+    np.ndarray
+        Complex signals along ``axis``
+    """
+    return _fft_backend.ifft(x, n=n, axis=axis, workers=_resolve_workers(workers))
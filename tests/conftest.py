@@ -19,11 +19,39 @@ def sample_eeg_data():
     n_channels = 18
 
     data = pd.DataFrame(
-        np.random.randn(n_samples, n_channels), columns=[f"Ch{i+1}" for i in range(n_channels)]
+        np.random.randn(n_samples, n_channels),
+        columns=[f"Ch{i+1}" for i in range(n_channels)],
+        copy=False,
     )
     return data
 
 
+@pytest.fixture(scope="session")
+def rand_arr():
+    """Seeded random (1000, 4) array shared by the whole session; read-only."""
+    # Drawn as (channels, samples) so each column is already contiguous, like pandas' blocks
+    arr = np.random.default_rng(0).standard_normal((4, 1000)).T
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture(scope="session")
+def tiny_arr():
+    """Seeded random (64, 4) array for tests that only check score bounds; read-only."""
+    arr = np.random.default_rng(1).standard_normal((4, 64)).T
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture(scope="session")
+def rand_df(rand_arr):
+    """Read-only DataFrame view of rand_arr shared by the whole session."""
+    df = pd.DataFrame(rand_arr, copy=False)
+    # Contiguous float64 columns map straight onto pandas' block: no copy
+    assert np.shares_memory(df.to_numpy(), rand_arr)
+    return df
+
+
 @pytest.fixture
 def sample_metadata():
     """Generate sample metadata for testing."""
@@ -45,7 +73,9 @@ def sample_epoch():
     n_channels = 18
 
     data = pd.DataFrame(
-        np.random.randn(n_samples, n_channels), columns=[f"Ch{i+1}" for i in range(n_channels)]
+        np.random.randn(n_samples, n_channels),
+        columns=[f"Ch{i+1}" for i in range(n_channels)],
+        copy=False,
     )
 
     return {
@@ -72,3 +102,45 @@ def bipolar_pairs():
         ("P3", "O1"),
         ("P4", "O2"),
     ]
+
+
+def write_wfdb_record(folder, name, raw, channels=("Fp1", "Fp2"), start_time="10:00:00"):
+    """Write a WFDB record (.hea + MAT v4 .mat) with int16 samples of shape (channels, samples)."""
+    import scipy.io
+
+    raw = np.asarray(raw, dtype=np.int16)
+    scipy.io.savemat(folder / f"{name}.mat", {"val": raw}, format="4")
+
+    gains = ["17.5(32)/uV", "10/uV"]
+    adc_zeros = [0, 5]
+    header = [f"{name} {len(channels)} 128 {raw.shape[1]}"]
+    for i, channel in enumerate(channels):
+        checksum = int(np.sum(raw[i], dtype=np.int16))
+        header.append(
+            f"{name}.mat 16+24 {gains[i % 2]} 16 {adc_zeros[i % 2]} "
+            f"{raw[i, 0]} {checksum} 0 {channel}"
+        )
+    header += [f"#Start time: {start_time}", "#End time: 10:05:00", "#Utility frequency: 50"]
+    (folder / f"{name}.hea").write_text("\n".join(header) + "\n", encoding="utf-8")
+
+    return str(folder / name)
+
+
+@pytest.fixture
+def wfdb_record(tmp_path):
+    """Write a small two-channel WFDB record and return its path."""
+    raw = np.array([[100, -200, 300, 32, 64], [0, 10, -10, 20, -20]], dtype=np.int16)
+    return write_wfdb_record(tmp_path, "rec", raw)
+
+
+@pytest.fixture
+def wfdb_data_folder(tmp_path):
+    """Create a data folder with one patient holding two WFDB recordings."""
+    patient_folder = tmp_path / "0284"
+    patient_folder.mkdir()
+    (patient_folder / "0284.txt").write_text("Patient: 0284\nHospital: A\nAge: 53\n")
+
+    write_wfdb_record(patient_folder, "0284_001_EEG", [[1, 2, 3], [4, 5, 6]])
+    write_wfdb_record(patient_folder, "0284_002_EEG", [[7, 8], [9, 10]], start_time="11:00:00")
+
+    return str(tmp_path)
@@ -0,0 +1,55 @@
+"""
+Performance Regression Tests
+
+Benchmarks the quality metrics on a large preallocated array and fails when
+the mean run time exceeds the ceiling stored in perf_baseline.json.
+Requires pytest-benchmark; skipped otherwise.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from chronoeeg.quality import metrics  # noqa: E402
+
+PERF_BASELINE = json.loads((Path(__file__).parent / "perf_baseline.json").read_text())
+
+METRIC_KWARGS = {
+    "calculate_nan_quality": {},
+    "calculate_gap_quality": {},
+    "calculate_outlier_quality": {"threshold": 3.0},
+    "calculate_basic_quality": {"threshold": 2.0},
+    "calculate_flatline_quality": {"sampling_rate": 128},
+    "calculate_sharpness_quality": {"amplitude_threshold": 0.05},
+    "calculate_cohesion_quality": {},
+}
+
+
+@pytest.fixture(scope="module")
+def big_arr():
+    """Seeded random (1_000_000, 4) array with contiguous columns; read-only."""
+    arr = np.random.default_rng(0).standard_normal((4, 1_000_000)).T
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="quality")
+class TestQualityBenchmarks:
+    """Guard the quality metrics against silent slowdowns."""
+
+    @pytest.mark.parametrize("name", sorted(METRIC_KWARGS))
+    def test_metric_perf(self, benchmark, big_arr, name):
+        """Test that a metric stays under its ceiling on a large array."""
+        metric = getattr(metrics, name)
+        benchmark.pedantic(
+            metric, args=(big_arr,), kwargs=METRIC_KWARGS[name], rounds=3, warmup_rounds=1
+        )
+
+        # No statistics are collected under --benchmark-disable
+        if benchmark.stats is not None:
+            assert benchmark.stats.stats.mean < PERF_BASELINE[name]
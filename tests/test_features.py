@@ -84,6 +84,60 @@ class TestClassicalFeatureExtractor:
         fractal_cols = [c for c in features.columns if "FRC_" in c]
         assert len(fractal_cols) > 0
 
+    def test_hjorth_features(self):
+        """Test Hjorth feature extraction against antropy."""
+        import antropy as ant
+
+        np.random.seed(42)
+        data = pd.DataFrame(
+            {
+                "Ch1": np.random.randn(1000),
+                "Ch2": np.cumsum(np.random.randn(1000)),
+            }
+        )
+
+        extractor = ClassicalFeatureExtractor(sampling_rate=128, include_hjorth=True)
+        features = extractor.extract(data)
+
+        default = ClassicalFeatureExtractor(sampling_rate=128).extract(data)
+        assert not any(c.startswith("HJO_") for c in default.columns)
+
+        for channel in data.columns:
+            mobility, complexity = ant.hjorth_params(data[channel].values)
+            assert features[f"HJO_mobility_{channel}"].iloc[0] == pytest.approx(mobility)
+            assert features[f"HJO_complexity_{channel}"].iloc[0] == pytest.approx(complexity)
+            assert features[f"HJO_activity_{channel}"].iloc[0] == pytest.approx(
+                data[channel].var(ddof=0)
+            )
+            assert features[f"HJO_line_length_{channel}"].iloc[0] == pytest.approx(
+                data[channel].diff().abs().sum()
+            )
+
+    def test_hjorth_kernel_from_threads(self):
+        """Test that concurrent Hjorth kernel calls match serial ones."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from chronoeeg.features import _kernels
+
+        rng = np.random.default_rng(0)
+        batches = [rng.standard_normal((8, 2000)) for _ in range(8)]
+        expected = [_kernels.hjorth_all(x) for x in batches]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_kernels.hjorth_all, batches))
+
+        for result, reference in zip(results, expected):
+            for values, ref in zip(result, reference):
+                np.testing.assert_allclose(values, ref)
+
+        if _kernels.HAS_NUMBA:
+            import numba
+
+            # Launches are only serialized on the workqueue layer
+            needs_lock = numba.threading_layer() == "workqueue"
+            guard = _kernels._parallel_launch_guard()
+            assert (guard is _kernels._PARALLEL_LAUNCH_LOCK) == needs_lock
+
 
 class TestFMMFeatureExtractor:
     """Tests for FMMFeatureExtractor."""
@@ -112,3 +166,19 @@ class TestFMMFeatureExtractor:
         except Exception:
             # FMM can fail with synthetic data, which is expected
             pytest.skip("FMM extraction failed with synthetic data")
+
+    def test_flat_channel(self):
+        """Test that an all-zero channel does not break the decomposition."""
+        np.random.seed(42)
+        data = pd.DataFrame(
+            {
+                "Ch1": np.random.randn(512) + 10 * np.sin(np.linspace(0, 8 * np.pi, 512)),
+                "Ch2": np.zeros(512),
+            }
+        )
+
+        features = FMMFeatureExtractor(n_components=2).extract(data)
+
+        assert features.shape == (2, 6)
+        assert np.allclose(features["FMM_A_Ch2"], 0)
+        assert np.isclose(features["FMM_R2"].sum(), 1)
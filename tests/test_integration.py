@@ -2,6 +2,8 @@
 Integration tests for complete workflows.
 """
 
+import cmath
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -16,30 +18,44 @@ from chronoeeg import (
 )
 
 
+def _sine_wave(freq: float, n_samples: int, fs: float) -> np.ndarray:
+    """
+    Generate sin(2*pi*freq*t) by recursive doubling of a unit rotation.
+
+    Each step multiplies the block of samples computed so far by the
+    rotation z**k, so only log2(n_samples) complex exponentials are needed.
+    """
+    samples = np.empty(n_samples, dtype=np.complex128)
+    samples[0] = 1.0
+    filled = 1
+    while filled < n_samples:
+        step = min(filled, n_samples - filled)
+        rotation = cmath.exp(2j * cmath.pi * freq * filled / fs)
+        samples[filled : filled + step] = samples[:step] * rotation
+        filled += step
+    return samples.imag
+
+
 class TestCompleteWorkflow:
     """Test complete end-to-end workflows."""
 
     @pytest.fixture
     def synthetic_eeg(self):
         """Generate synthetic EEG data for testing."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         # 15 minutes of data at 128 Hz
         n_samples = 128 * 60 * 15
         n_channels = 6
 
-        # Simulate EEG with multiple frequency components
-        time = np.arange(n_samples) / 128
-        data = np.zeros((n_samples, n_channels))
+        # Simulate EEG with multiple frequency components, shared by all channels
+        sines_sum = (
+            20 * _sine_wave(2, n_samples, 128)  # Delta (1-4 Hz)
+            + 30 * _sine_wave(10, n_samples, 128)  # Alpha (8-13 Hz)
+            + 15 * _sine_wave(20, n_samples, 128)  # Beta (13-30 Hz)
+        )
 
-        for i in range(n_channels):
-            # Delta (1-4 Hz)
-            data[:, i] += 20 * np.sin(2 * np.pi * 2 * time)
-            # Alpha (8-13 Hz)
-            data[:, i] += 30 * np.sin(2 * np.pi * 10 * time)
-            # Beta (13-30 Hz)
-            data[:, i] += 15 * np.sin(2 * np.pi * 20 * time)
-            # Add noise
-            data[:, i] += np.random.randn(n_samples) * 5
+        # Add independent noise per channel
+        data = sines_sum[:, np.newaxis] + rng.standard_normal((n_samples, n_channels)) * 5
 
         channels = ["Fp1", "Fp2", "F3", "F4", "C3", "C4"]
         return pd.DataFrame(data, columns=channels)
@@ -164,6 +180,105 @@ class TestCompleteWorkflow:
         for result in results:
             assert "epoch_id" in result.columns
 
+    def test_parallel_process_batches(self):
+        """Test that batched parallel processing preserves item order."""
+        from chronoeeg.utils import parallel_process
+
+        items = list(range(23))
+
+        assert parallel_process(lambda x: x * x, items, n_jobs=2) == [x * x for x in items]
+        assert parallel_process(lambda x: -x, items, n_jobs=2, chunked=False) == [-x for x in items]
+        assert parallel_process(lambda x: x + 1, items, n_jobs=2, prefer="threads") == [
+            x + 1 for x in items
+        ]
+
+        with pytest.raises(ValueError):
+            parallel_process(abs, items, prefer="gpu")
+
+    def test_threaded_pipeline(self, synthetic_eeg):
+        """Test that threaded feature extraction matches the sequential pipeline."""
+        kwargs = dict(epoch_duration=60, sampling_rate=128, extract_fmm=False)
+
+        sequential = EEGAnalysisPipeline(n_jobs=1, **kwargs).process(synthetic_eeg)
+        pipeline = EEGAnalysisPipeline(n_jobs=2, **kwargs)
+        threaded = pipeline.process(synthetic_eeg)
+
+        assert len(threaded["features"]) > 1
+        pd.testing.assert_frame_equal(threaded["features"], sequential["features"])
+
+        # The extractor does not keep the input alive after process returns
+        with pytest.raises(ValueError):
+            pipeline.epoch_extractor.epochs_view
+
+    def test_threaded_fmm_uses_one_fft_worker(self, synthetic_eeg, monkeypatch):
+        """Test that only threaded FMM extraction runs each FFT on a single worker."""
+        import threading
+        from types import SimpleNamespace
+
+        from chronoeeg.utils import spectral
+
+        backend = spectral._fft_backend
+        calls = []
+        lock = threading.Lock()
+
+        def recording(name):
+            def transform(*args, workers, **kwargs):
+                with lock:
+                    calls.append(workers)
+                return getattr(backend, name)(*args, workers=workers, **kwargs)
+
+            return transform
+
+        monkeypatch.setattr(
+            spectral,
+            "_fft_backend",
+            SimpleNamespace(**{name: recording(name) for name in ("rfft", "fft", "ifft")}),
+        )
+
+        pipeline = EEGAnalysisPipeline(
+            epoch_duration=20,
+            sampling_rate=128,
+            extract_classical=False,
+            n_fmm_components=2,
+            n_jobs=2,
+        )
+        results = pipeline.process(synthetic_eeg.iloc[: 128 * 40])
+
+        assert results["features"]["epoch_id"].nunique() == 2
+        assert calls and set(calls) == {1}
+
+        # Direct calls outside the pipeline keep using all cores
+        calls.clear()
+        FMMFeatureExtractor(n_components=2).extract(synthetic_eeg.iloc[: 128 * 20])
+        assert calls and set(calls) == {-1}
+
+    def test_fft_workers_follow_the_caller(self, synthetic_eeg):
+        """Test that only epochs fanned out over threads get single-worker FFTs."""
+        import scipy.fft
+
+        class WorkerProbe:
+            def __init__(self):
+                self.workers = []
+
+            def extract(self, data):
+                self.workers.append(scipy.fft.get_workers())
+                return pd.DataFrame(index=[0])
+
+        with scipy.fft.set_workers(-1):
+            all_cores = scipy.fft.get_workers()
+
+        pipeline = EEGAnalysisPipeline(epoch_duration=20, sampling_rate=128, n_jobs=2)
+        probe = WorkerProbe()
+        pipeline.extractors = {"probe": probe}
+
+        # fit_transform walks its epochs sequentially through _extract_features
+        pipeline._extract_features(synthetic_eeg.iloc[: 128 * 20])
+        assert probe.workers == [all_cores]
+
+        probe.workers.clear()
+        pipeline.process(synthetic_eeg.iloc[: 128 * 40])
+        assert probe.workers == [1, 1]
+
     def test_error_handling(self):
         """Test error handling in workflow."""
         # Empty data should raise error
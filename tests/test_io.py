@@ -39,7 +39,7 @@ class TestDataValidator:
 
         # Introduce many NaNs
         data_with_nans = sample_eeg_data.copy()
-        mask = np.random.rand(*data_with_nans.shape) < 0.6
+        mask = np.random.default_rng(0).random(data_with_nans.shape) < 0.6
         data_with_nans = data_with_nans.mask(mask)
 
         is_valid, issues = validator.validate_dataframe(data_with_nans)
@@ -50,12 +50,13 @@ class TestDataValidator:
     def test_validate_constant_channels(self):
         """Test detection of constant channels."""
         validator = DataValidator()
+        rng = np.random.default_rng(0)
 
         data = pd.DataFrame(
             {
-                "Ch1": np.random.randn(100),
+                "Ch1": rng.standard_normal(100),
                 "Ch2": np.ones(100),  # Constant channel
-                "Ch3": np.random.randn(100),
+                "Ch3": rng.standard_normal(100),
             }
         )
 
@@ -84,7 +85,7 @@ class TestEEGDataLoader:
         extractor = DummyExtractor()
 
         # Test numpy array conversion
-        np_data = np.random.randn(100, 5)
+        np_data = np.random.default_rng(0).standard_normal((100, 5))
         df = extractor._validate_input(np_data)
 
         assert isinstance(df, pd.DataFrame)
@@ -102,3 +103,198 @@ class TestEEGDataLoader:
 
         with pytest.raises(ValueError, match="empty"):
             extractor._validate_input(pd.DataFrame())
+
+    def test_load_patient_concatenates_recordings(self, wfdb_data_folder):
+        """Test loading a patient whose recordings share the same channels."""
+        loader = EEGDataLoader(data_folder=wfdb_data_folder)
+        data, metadata = loader.load_patient("0284")
+
+        assert list(data.columns) == ["Fp1", "Fp2"]
+        assert data.dtypes.eq(np.float32).all()
+        np.testing.assert_allclose(data["Fp1"], (np.array([1, 2, 3, 7, 8]) - 32) / 17.5)
+        np.testing.assert_allclose(data["Fp2"], (np.array([4, 5, 6, 9, 10]) - 5) / 10)
+        assert data["Fp1"].to_numpy().flags.c_contiguous
+        assert metadata["num_recordings"] == 2
+        assert metadata["Start time"] == "10:00:00"
+        assert metadata["Hospital"] == "A"
+
+    def test_find_patients_and_recordings(self, wfdb_data_folder):
+        """Test discovery of patient folders and their recordings."""
+        import os
+
+        os.mkdir(os.path.join(wfdb_data_folder, "empty"))
+        os.mkdir(os.path.join(wfdb_data_folder, ".hidden"))
+        loader = EEGDataLoader(data_folder=wfdb_data_folder)
+
+        assert loader.find_patients() == ["0284"]
+        assert loader.list_recordings("0284") == ["0284_001_EEG", "0284_002_EEG"]
+
+    def test_find_recording_files_selection(self, wfdb_data_folder):
+        """Test exact and partial recording selection without duplicates."""
+        import os
+
+        loader = EEGDataLoader(data_folder=wfdb_data_folder)
+        patient_folder = os.path.join(wfdb_data_folder, "0284")
+
+        files = loader._find_recording_files(patient_folder, ["0284_002_EEG", "EEG", "002"])
+
+        assert files == [
+            os.path.join(patient_folder, "0284_001_EEG"),
+            os.path.join(patient_folder, "0284_002_EEG"),
+        ]
+        with pytest.raises(ValueError, match="not found"):
+            loader._find_recording_files(patient_folder, ["ECG"])
+
+    def test_load_recording_lazy(self, wfdb_data_folder):
+        """Test that lazy loading defers conversion to physical units."""
+        import os
+
+        loader = EEGDataLoader(data_folder=wfdb_data_folder)
+        record_path = os.path.join(wfdb_data_folder, "0284", "0284_001_EEG")
+
+        data, _ = loader.load_recording(record_path)
+        recording, metadata = loader.load_recording(record_path, lazy=True)
+
+        assert recording.samples.dtype == np.int16
+        assert len(recording) == len(data) == metadata["num_samples"]
+        assert recording.channels == list(data.columns)
+        assert not recording.missing_mask().any()
+        np.testing.assert_array_equal(recording.to_physical(1, 3), data.iloc[1:3].to_numpy())
+
+    def test_load_patient_cache(self, wfdb_data_folder, tmp_path_factory, monkeypatch):
+        """Test that cached patients are reused until a file in the folder changes."""
+        import os
+
+        cache_dir = str(tmp_path_factory.mktemp("cache"))
+        expected, _ = EEGDataLoader(data_folder=wfdb_data_folder).load_patient("0284")
+
+        EEGDataLoader(data_folder=wfdb_data_folder, cache_dir=cache_dir).load_patient("0284")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("recordings were decoded again")
+
+        loader = EEGDataLoader(data_folder=wfdb_data_folder, cache_dir=cache_dir)
+        monkeypatch.setattr(loader, "_load_recordings", fail)
+        data, metadata = loader.load_patient("0284")
+        pd.testing.assert_frame_equal(data, expected)
+        assert "BMI" not in metadata
+
+        # Cache hits behave like fresh loads: writable, and not shared between calls
+        data.iloc[0, 0] = 1e6
+        again, _ = loader.load_patient("0284")
+        pd.testing.assert_frame_equal(again, expected)
+
+        with open(os.path.join(wfdb_data_folder, "0284", "0284.txt"), "a") as f:
+            f.write("BMI: 21\n")
+        monkeypatch.undo()
+        _, metadata = loader.load_patient("0284")
+        assert metadata["BMI"] == "21"
+
+
+class TestWFDBReader:
+    """Tests for the WFDB reader."""
+
+    def test_load_recording_data_rescales(self, wfdb_record):
+        """Test conversion of digital samples to physical units."""
+        from chronoeeg.io.wfdb_reader import load_recording_data
+
+        recording = load_recording_data(wfdb_record, check_values=True)
+        signals = recording["signals"]
+
+        assert signals.dtype == np.float32
+        assert signals.shape == (5, 2)
+        assert signals.flags.f_contiguous
+        assert recording["channels"] == ["Fp1", "Fp2"]
+        np.testing.assert_allclose(
+            signals[:, 0], (np.array([100, -200, 300, 32, 64]) - 32) / 17.5, rtol=1e-6
+        )
+        np.testing.assert_allclose(signals[:, 1], (np.array([0, 10, -10, 20, -20]) - 5) / 10)
+        assert recording["start_time"] == "10:00:00"
+
+    def test_load_recording_data_mat_v5_fallback(self, wfdb_record):
+        """Test that MAT v5 signal files are read through scipy instead of mmap."""
+        import scipy.io
+
+        from chronoeeg.io.wfdb_reader import load_recording_data
+
+        mmapped = load_recording_data(wfdb_record)["signals"]
+        raw = scipy.io.loadmat(wfdb_record + ".mat")["val"]
+        scipy.io.savemat(wfdb_record + ".mat", {"val": raw})
+
+        np.testing.assert_array_equal(load_recording_data(wfdb_record)["signals"], mmapped)
+
+    def test_load_recording_data_tab_delimited_header(self, wfdb_record):
+        """Test parsing of headers whose fields are separated by tabs."""
+        from chronoeeg.io.wfdb_reader import load_recording_data
+
+        with open(wfdb_record + ".hea", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        lines = [line if line.startswith("#") else line.replace(" ", "\t") for line in lines]
+        with open(wfdb_record + ".hea", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        recording = load_recording_data(wfdb_record)
+
+        assert recording["gains"] == [17.5, 10.0]
+        assert recording["baselines"] == [32.0, 0.0]
+        assert recording["channels"] == ["Fp1", "Fp2"]
+
+    def test_header_parse_is_cached_until_file_changes(self, wfdb_record):
+        """Test that an unchanged header is parsed once and a modified one again."""
+        import os
+
+        from chronoeeg.io.wfdb_reader import _parse_header
+
+        header = _parse_header(wfdb_record)
+        assert _parse_header(wfdb_record + ".hea") is header
+
+        stat = os.stat(wfdb_record + ".hea")
+        os.utime(wfdb_record + ".hea", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _parse_header(wfdb_record) is not header
+
+    def test_check_values_reports_all_bad_channels(self, wfdb_record):
+        """Test that every channel with a wrong checksum is reported."""
+        from chronoeeg.io.wfdb_reader import load_recording_data
+
+        with open(wfdb_record + ".hea", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        for i in (1, 2):
+            fields = lines[i].split()
+            fields[6] = str(int(fields[6]) + 1)
+            lines[i] = " ".join(fields)
+        with open(wfdb_record + ".hea", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        with pytest.raises(ValueError, match=r"checksum.*\['Fp1', 'Fp2'\]"):
+            load_recording_data(wfdb_record, check_values=True)
+
+    def test_parse_metadata(self):
+        """Test parsing of plain and commented metadata lines."""
+        from chronoeeg.io.wfdb_reader import parse_metadata
+
+        text = "Patient: 0284\n# Hospital : A \r\n#Start time: 10:05:00\nno colon here\nCPC:\n"
+
+        assert parse_metadata(text) == {
+            "Patient": "0284",
+            "Hospital": "A",
+            "Start time": "10:05:00",
+            "CPC": "",
+        }
+
+    def test_get_variable(self):
+        """Test variable lookup from metadata text or a parsed dict."""
+        from chronoeeg.io.wfdb_reader import get_variable, parse_metadata
+
+        text = (
+            "Outcome Probability: 0.8\nOutcome: Good\nAge: 53\nOHCA: True\n#Start time: 10:05:00\n"
+        )
+
+        assert get_variable(text, "Outcome", str) == "Good"
+        assert get_variable(text, "Age", int) == 53
+        assert get_variable(text, "OHCA", bool) is True
+        assert get_variable(text, "#Start time", str) == "10:05:00"
+        assert get_variable(text, "TTM", int) is None
+
+        metadata = parse_metadata(text)
+        assert get_variable(metadata, "Outcome Probability", float) == 0.8
+        assert get_variable(metadata, "#Start time", str) == "10:05:00"
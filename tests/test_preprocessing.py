@@ -78,6 +78,48 @@ class TestEpochExtractor:
 
         assert isinstance(epochs, list)
 
+    def test_fit_transform_epoch_views(self, sample_eeg_data):
+        """Test that fit_transform exposes epochs as views over the input."""
+        extractor = EpochExtractor(epoch_duration=60, overlap=0.5, sampling_rate=128)
+        epochs = extractor.fit_transform(sample_eeg_data)
+
+        n_epochs = epochs["epoch_id"].nunique()
+        assert extractor.epochs_view.shape == (n_epochs, 60 * 128, sample_eeg_data.shape[1])
+
+        second = extractor[1]
+        assert list(second.columns) == list(sample_eeg_data.columns)
+        assert np.shares_memory(second.to_numpy(), sample_eeg_data.to_numpy())
+        np.testing.assert_array_equal(
+            second.to_numpy(), sample_eeg_data.iloc[30 * 128 : 90 * 128].to_numpy()
+        )
+        np.testing.assert_array_equal(
+            second.to_numpy(),
+            epochs.loc[epochs["epoch_id"] == 1].drop(columns="epoch_id").to_numpy(),
+        )
+
+        extractor.clear_epochs()
+        with pytest.raises(ValueError):
+            extractor.epochs_view
+
+    def test_fit_transform_keeps_dtypes(self):
+        """Test that fit_transform keeps the per-column dtypes of mixed inputs."""
+        rng = np.random.default_rng(0)
+        n_samples = 3 * 128
+        data = pd.DataFrame(
+            {
+                "counts": rng.integers(0, 100, n_samples),
+                "signal": rng.standard_normal(n_samples).astype(np.float32),
+                "label": np.repeat(["a", "b", "c"], 128),
+            }
+        )
+
+        extractor = EpochExtractor(epoch_duration=1, sampling_rate=128)
+        epochs = extractor.fit_transform(data)
+
+        pd.testing.assert_series_equal(epochs.dtypes.drop("epoch_id"), data.dtypes)
+        pd.testing.assert_frame_equal(epochs.drop(columns="epoch_id"), data, check_index_type=False)
+        pd.testing.assert_frame_equal(extractor[1], data.iloc[128:256].reset_index(drop=True))
+
 
 class TestBipolarMontage:
     """Tests for BipolarMontage class."""
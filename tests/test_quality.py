@@ -14,43 +14,98 @@ from chronoeeg.quality import QualityAssessor, metrics
 class TestQualityMetrics:
     """Tests for individual quality metrics."""
 
-    def test_nan_quality(self):
+    def test_nan_quality(self, rand_arr):
         """Test NaN quality metric."""
         # Data with no NaNs
-        data_clean = pd.DataFrame(np.random.randn(1000, 4))
-        quality = metrics.calculate_nan_quality(data_clean)
+        quality = metrics.calculate_nan_quality(rand_arr)
         assert quality == 100.0  # 0-100 scale
 
         # Data with some NaNs
-        data_nans = data_clean.copy()
-        data_nans.iloc[:100, 0] = np.nan
+        data_nans = rand_arr.copy()
+        data_nans[:100, 0] = np.nan
         quality = metrics.calculate_nan_quality(data_nans)
         assert 0 < quality < 100.0  # 0-100 scale
 
-    def test_gap_quality(self):
+    def test_gap_quality(self, tiny_arr):
         """Test gap quality metric."""
-        data = pd.DataFrame(np.random.randn(1000, 4))
-        quality = metrics.calculate_gap_quality(data)
+        quality = metrics.calculate_gap_quality(tiny_arr)
         assert 0 <= quality <= 100.0  # 0-100 scale
 
-    def test_outlier_quality(self):
+    def test_outlier_quality(self, tiny_arr):
         """Test outlier quality metric."""
-        data = pd.DataFrame(np.random.randn(1000, 4))
-        quality = metrics.calculate_outlier_quality(data, threshold=3.0)
+        quality = metrics.calculate_outlier_quality(tiny_arr, threshold=3.0)
         assert 0 <= quality <= 100.0  # 0-100 scale
 
-    def test_flatline_quality(self):
+    def test_flatline_quality(self, tiny_arr):
         """Test flatline quality metric."""
-        data = pd.DataFrame(np.random.randn(1000, 4))
-        quality = metrics.calculate_flatline_quality(data, sampling_rate=128)
+        quality = metrics.calculate_flatline_quality(tiny_arr, sampling_rate=128)
         assert 0 <= quality <= 100.0  # 0-100 scale
 
-    def test_cohesion_quality(self):
+    def test_sharpness_quality(self, rand_arr):
+        """Test sharpness quality metric."""
+        quality = metrics.calculate_sharpness_quality(rand_arr, amplitude_threshold=0.05)
+        assert 0 <= quality <= 100.0  # 0-100 scale
+
+    def test_cohesion_quality(self, tiny_arr):
         """Test cohesion quality metric."""
-        data = pd.DataFrame(np.random.randn(1000, 4))
-        quality = metrics.calculate_cohesion_quality(data)
+        quality = metrics.calculate_cohesion_quality(tiny_arr)
         assert quality >= 0  # Cohesion can vary widely
 
+    def test_dataframe_and_array_inputs_agree(self, rand_arr, rand_df):
+        """Test that every metric gives the same score for a DataFrame and its array."""
+        data_nans = rand_arr.copy()
+        data_nans[100:200, 0] = np.nan
+
+        for df, arr in ((rand_df, rand_arr), (pd.DataFrame(data_nans, copy=False), data_nans)):
+            assert metrics.calculate_nan_quality(df) == metrics.calculate_nan_quality(arr)
+            assert metrics.calculate_gap_quality(df) == metrics.calculate_gap_quality(arr)
+            assert metrics.calculate_outlier_quality(df) == metrics.calculate_outlier_quality(arr)
+            assert metrics.calculate_flatline_quality(df, 128) == pytest.approx(
+                metrics.calculate_flatline_quality(arr, 128)
+            )
+            assert metrics.calculate_sharpness_quality(df) == pytest.approx(
+                metrics.calculate_sharpness_quality(arr)
+            )
+            assert metrics.calculate_cohesion_quality(df) == pytest.approx(
+                metrics.calculate_cohesion_quality(arr)
+            )
+
+    def test_kernels_match_numpy(self, rand_arr):
+        """Test that the compiled NaN and outlier counts match NumPy."""
+        from chronoeeg.quality._kernels import count_nan, count_outliers
+
+        arr = rand_arr
+        assert count_outliers(arr, 2.0) == np.count_nonzero(np.abs(arr) > 2.0 * arr.std())
+
+        with_nans = arr.copy()
+        with_nans[:10, 1] = np.nan
+        assert count_nan(with_nans) == 10
+        # A NaN makes the global std NaN, so nothing is flagged
+        assert count_outliers(with_nans, 2.0) == 0
+
+    def test_basic_quality_matches_metrics(self, rand_arr):
+        """Test that the fused NaN/gap/outlier scores match the individual metrics."""
+        data_nans = rand_arr.copy()
+        data_nans[100:200, 0] = np.nan
+        data_nans[300:310, 2] = np.nan
+
+        for data in (rand_arr, data_nans):
+            scores = metrics.calculate_basic_quality(data, threshold=2.0)
+            assert scores["nan_score"] == pytest.approx(metrics.calculate_nan_quality(data))
+            assert scores["gap_score"] == pytest.approx(metrics.calculate_gap_quality(data))
+            assert scores["outlier_score"] == pytest.approx(
+                metrics.calculate_outlier_quality(data, threshold=2.0)
+            )
+
+    def test_empty_input(self):
+        """Test that the count-based metrics give NaN for empty data."""
+        for empty in (np.empty((0, 4)), pd.DataFrame(np.empty((0, 4)))):
+            assert np.isnan(metrics.calculate_nan_quality(empty))
+            assert np.isnan(metrics.calculate_gap_quality(empty))
+            assert np.isnan(metrics.calculate_outlier_quality(empty))
+            scores = metrics.calculate_basic_quality(empty)
+            assert all(np.isnan(score) for score in scores.values())
+
 
 class TestQualityAssessor:
     """Tests for QualityAssessor class."""
@@ -69,10 +124,13 @@ class TestQualityAssessor:
         assert "overall_quality" in quality
         assert 0 <= quality["overall_quality"] <= 100.0
 
-    def test_assess_with_nans(self):
+    def test_assess_with_nans(self, rand_arr):
         """Test quality assessment with NaN values."""
-        data = pd.DataFrame(np.random.randn(1000, 4))
-        data.iloc[:500, 0] = np.nan
+        # Inject NaNs into the array, then wrap it without a copy
+        arr = rand_arr.copy(order="F")
+        arr[:500, 0] = np.nan
+        data = pd.DataFrame(arr, copy=False)
+        assert np.shares_memory(data.to_numpy(), arr)
 
         qa = QualityAssessor(sampling_rate=128)
         quality = qa.assess(data)
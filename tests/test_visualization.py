@@ -112,7 +112,7 @@ class TestVisualization:
 
     def test_plot_with_array(self):
         """Test plotting with numpy array input."""
-        data = np.random.randn(1000, 3) * 50
+        data = np.random.default_rng(0).standard_normal((1000, 3)) * 50
         fig = plot_signal(data, sampling_rate=128)
         assert fig is not None
         plt.close(fig)